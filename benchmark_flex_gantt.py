@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+benchmark_flex_gantt.py
+-----------------------
+Benchmark harness for flex_gantt.py using synthetic pipeline workbooks.
+
+Generates workbooks with the same column schema as the Marriott pipeline export
+(100, 1k, 10k and 100k events by default), then times each stage separately:
+
+- load_events (cold parse, cache disabled)
+- load_events_cached (parsed-workbook cache hit)
+- gantt_for_month, gantt_for_week, gantt_for_day and calendar_for_month
+
+Events are spread around today at a fixed density (--events-per-month), so the
+workbook grows with the pipeline size while each chart stays readable. Raise the
+density to stress the per-chart renderers with many overlapping events.
+
+Results are appended as one JSON line per run to logs/flex_gantt_benchmarks.jsonl.
+Pass --baseline to compare against the last record of an earlier results file;
+the script exits non-zero when any stage is slower than --max-slowdown allows.
+
+Usage examples
+--------------
+# Full suite (100, 1k, 10k, 100k events)
+python benchmark_flex_gantt.py
+
+# Quick run on the smaller sizes, 5 repeats each
+python benchmark_flex_gantt.py --sizes 100 1000 --repeat 5
+
+# Time the charts as rendered for the kiosk
+python benchmark_flex_gantt.py --profile kiosk-1080p
+
+# Check the current tree against a saved baseline
+python benchmark_flex_gantt.py --baseline logs/benchmark_baseline.jsonl
+"""
+import sys
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import matplotlib
+
+import flex_gantt
+
+SHEET_NAME = "Marriott Marquis Pipeline"
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000]
+DEFAULT_EVENTS_PER_MONTH = 40
+RESULTS_PATH = Path("logs") / "flex_gantt_benchmarks.jsonl"
+WORKBOOK_DIRNAME = ".flex_gantt_bench"
+
+# Same columns, in the same order, as the pipeline.xlsx export
+PIPELINE_COLUMNS = [
+    "(Do Not Modify) Opportunity", "(Do Not Modify) Row Checksum", "(Do Not Modify) Modified On",
+    "Event Start Date", "Event End Date", "Event Name", "End User Contact", "End User Account",
+    "Status Reason", "Est. Revenue", "Sales Stage", "Probability", "Owner", "Venue", "Created On",
+]
+
+OWNERS = ["Darren Lins", "David Calvillo", "Eder Castillo", "Sarah Brown", "Dylan Neal", "Derek Schmidt"]
+OWNER_WEIGHTS = [0.38, 0.19, 0.18, 0.16, 0.05, 0.04]
+STAGES = ["1 - Stage 1", "2 - Stage 2", "3 - Stage 3"]
+PROBABILITIES = ["25%", "50%", "80%", "100%"]
+# Event lengths in days, roughly matching the real pipeline (median ~5 days)
+DURATION_DAYS = [0, 1, 2, 3, 4, 5, 7, 10, 14, 30]
+DURATION_WEIGHTS = [0.08, 0.10, 0.14, 0.14, 0.12, 0.14, 0.12, 0.08, 0.05, 0.03]
+ICW_SHARE = 0.1  # Fraction of events named like ICW bookings (exercises the filter rules)
+
+def synthetic_pipeline(n_events: int, events_per_month: int = DEFAULT_EVENTS_PER_MONTH,
+                       seed: int = 0, today: pd.Timestamp = None) -> pd.DataFrame:
+    """Build a pipeline DataFrame with n_events rows centered on today."""
+    rng = np.random.default_rng(seed)
+    today = (today or pd.Timestamp.now()).normalize()
+
+    # Spread events over enough months to hold the requested density
+    span_days = max(30, int(round(n_events / max(events_per_month, 1) * 30)))
+    first_day = today - pd.Timedelta(days=span_days // 2)
+    start_offsets = rng.integers(0, span_days, n_events)
+    # Most events start at midnight; some carry a start hour for the daily chart
+    start_hours = np.where(rng.random(n_events) < 0.3, rng.integers(7, 19, n_events), 0)
+    starts = first_day + pd.to_timedelta(start_offsets, unit="D") + pd.to_timedelta(start_hours, unit="h")
+    durations = rng.choice(DURATION_DAYS, n_events, p=DURATION_WEIGHTS)
+    ends = starts.normalize() + pd.to_timedelta(durations, unit="D")
+    created = starts - pd.to_timedelta(rng.integers(14, 365, n_events), unit="D")
+
+    ids = np.arange(n_events)
+    accounts = np.char.add("Synthetic Account ", (ids % 997).astype(str))
+    names = np.char.add(np.char.add(accounts, " Event "), ids.astype(str))
+    icw = rng.random(n_events) < ICW_SHARE
+    names = np.where(icw, np.char.add("ICW ", names), names)
+
+    df = pd.DataFrame({
+        "(Do Not Modify) Opportunity": [f"{i:08x}-0000-4000-8000-{seed:012x}" for i in ids],
+        "(Do Not Modify) Row Checksum": [f"{v:016x}" for v in rng.integers(0, 2**62, n_events)],
+        "(Do Not Modify) Modified On": created + pd.Timedelta(days=7),
+        "Event Start Date": starts,
+        "Event End Date": ends,
+        "Event Name": names,
+        "End User Contact": np.char.add("Contact ", (ids % 499).astype(str)),
+        "End User Account": accounts,
+        "Status Reason": np.where(rng.random(n_events) < 0.1, "Won", "Open"),
+        "Est. Revenue": np.round(rng.gamma(2.0, 15000.0, n_events), 2),
+        "Sales Stage": rng.choice(STAGES, n_events, p=[0.7, 0.2, 0.1]),
+        "Probability": rng.choice(PROBABILITIES, n_events, p=[0.4, 0.15, 0.35, 0.1]),
+        "Owner": rng.choice(OWNERS, n_events, p=OWNER_WEIGHTS),
+        "Venue": "Marriott Marquis Chicago",
+        "Created On": created,
+    })
+    return df[PIPELINE_COLUMNS]
+
+
+def synthetic_workbook(workdir: Path, n_events: int, events_per_month: int, seed: int) -> Path:
+    """Write (or reuse) the synthetic workbook for one size."""
+    today = pd.Timestamp.now().normalize()
+    path = workdir / f"synthetic_{n_events}_{events_per_month}epm_seed{seed}_{today:%Y%m%d}.xlsx"
+    if path.exists():
+        return path
+
+    print(f"  Generating {path.name}...")
+    workdir.mkdir(parents=True, exist_ok=True)
+    df = synthetic_pipeline(n_events, events_per_month, seed, today)
+    tmp_path = path.with_name(path.stem + ".tmp.xlsx")
+    df.to_excel(tmp_path, sheet_name=SHEET_NAME, index=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def time_call(func, repeat: int) -> dict:
+    """Run func repeat times with its output captured; return min/median seconds."""
+    samples = []
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - start)
+    return {
+        "min_s": round(min(samples), 4),
+        "median_s": round(statistics.median(samples), 4),
+        "runs": len(samples),
+    }
+
+
+def benchmark_size(workbook: Path, n_events: int, repeat: int, outdir: Path,
+                   profile: str = flex_gantt.DEFAULT_PROFILE) -> dict:
+    """Time load_events and each renderer on one synthetic workbook."""
+    timings = {}
+    errors = {}
+
+    def measure(stage: str, func, runs: int = repeat):
+        try:
+            timings[stage] = time_call(func, runs)
+            print(f"  {stage:<20} {timings[stage]['median_s']:>9.4f}s (min {timings[stage]['min_s']:.4f}s)")
+        except Exception as e:
+            errors[stage] = f"{type(e).__name__}: {e}"
+            print(f"  {stage:<20} failed: {errors[stage]}")
+
+    measure("load_events", lambda: flex_gantt.load_events(workbook, SHEET_NAME, use_cache=False))
+    # Prime the parsed-workbook cache, then time a cache hit
+    with redirect_stdout(io.StringIO()):
+        df = flex_gantt.load_events(workbook, SHEET_NAME)
+    measure("load_events_cached", lambda: flex_gantt.load_events(workbook, SHEET_NAME))
+
+    # Month and calendar benchmarks use the current month, like the dashboard
+    today = pd.Timestamp.now()
+    year, month = today.year, today.month
+    month_events = len(flex_gantt.events_in_window(
+        df, pd.Timestamp(year, month, 1), pd.Timestamp(year, month, 1) + pd.offsets.MonthEnd(0)))
+
+    # force=True so repeats time a full render rather than the render-skip check
+    options = {"force": True, "profile": profile}
+    measure("gantt_for_month", lambda: flex_gantt.gantt_for_month(df, year, month, outdir, **options))
+    measure("gantt_for_week", lambda: flex_gantt.gantt_for_week(df, outdir, **options))
+    measure("gantt_for_day", lambda: flex_gantt.gantt_for_day(df, outdir, **options))
+    measure("calendar_for_month", lambda: flex_gantt.calendar_for_month(df, year, month, outdir, **options))
+
+    return {
+        "events": n_events,
+        "events_in_month": month_events,
+        "workbook_bytes": workbook.stat().st_size,
+        "timings": timings,
+        "errors": errors,
+    }
+
+
+def git_commit() -> str:
+    """Short hash of the checked-out commit (None outside a git checkout)."""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=Path(__file__).parent, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def load_baseline(path: Path) -> dict:
+    """Return the last benchmark record in a results file."""
+    lines = [line for line in path.read_text().splitlines() if line.strip()]
+    if not lines:
+        raise ValueError(f"No benchmark records in {path}")
+    return json.loads(lines[-1])
+
+
+def compare_to_baseline(record: dict, baseline: dict, max_slowdown: float) -> list[str]:
+    """Print median-time ratios against the baseline and return the regressions."""
+    baseline_results = {r["events"]: r["timings"] for r in baseline.get("results", [])}
+    regressions = []
+
+    print(f"\nComparison with baseline {baseline.get('git_commit') or ''} ({baseline.get('timestamp')}):")
+    for result in record["results"]:
+        old_timings = baseline_results.get(result["events"])
+        if old_timings is None:
+            continue
+        for stage, timing in result["timings"].items():
+            if stage not in old_timings or not old_timings[stage]["median_s"]:
+                continue
+            ratio = timing["median_s"] / old_timings[stage]["median_s"]
+            flag = ""
+            if ratio > max_slowdown:
+                flag = "  <-- REGRESSION"
+                regressions.append(f"{stage} @ {result['events']} events: {ratio:.2f}x")
+            print(f"  {result['events']:>7} {stage:<20} {old_timings[stage]['median_s']:>9.4f}s -> "
+                  f"{timing['median_s']:>9.4f}s ({ratio:.2f}x){flag}")
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Benchmark flex_gantt.py on synthetic pipeline workbooks")
+    p.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES,
+                   help="Event counts to benchmark (default: 100 1000 10000 100000)")
+    p.add_argument("--events-per-month", type=int, default=DEFAULT_EVENTS_PER_MONTH,
+                   help=f"Event density around today (default: {DEFAULT_EVENTS_PER_MONTH})")
+    p.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (default: 3)")
+    p.add_argument("--profile", choices=sorted(flex_gantt.RENDER_PROFILES), default=flex_gantt.DEFAULT_PROFILE,
+                   help=f"Render profile for the chart timings (default: {flex_gantt.DEFAULT_PROFILE})")
+    p.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic data")
+    p.add_argument("--workdir", type=Path, default=Path(WORKBOOK_DIRNAME),
+                   help=f"Where synthetic workbooks are kept between runs (default: {WORKBOOK_DIRNAME})")
+    p.add_argument("--output", type=Path, default=RESULTS_PATH,
+                   help=f"JSON-lines results file to append to (default: {RESULTS_PATH})")
+    p.add_argument("--baseline", type=Path,
+                   help="Results file whose last record is the baseline to compare against")
+    p.add_argument("--max-slowdown", type=float, default=1.5,
+                   help="Fail when a stage's median is this many times the baseline (default: 1.5)")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.repeat < 1:
+        sys.exit("Error: --repeat must be at least 1")
+
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_baseline(args.baseline)
+        except (OSError, ValueError) as e:
+            sys.exit(f"Invalid baseline: {e}")
+
+    record = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "matplotlib": matplotlib.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "events_per_month": args.events_per_month,
+        "profile": args.profile,
+        "repeat": args.repeat,
+        "results": [],
+    }
+
+    outdir = Path(tempfile.mkdtemp(prefix="flex_gantt_bench_"))
+    try:
+        for n_events in sorted(set(args.sizes)):
+            print(f"\nBenchmarking {n_events:,} events")
+            workbook = synthetic_workbook(args.workdir, n_events, args.events_per_month, args.seed)
+            record["results"].append(benchmark_size(workbook, n_events, args.repeat, outdir, args.profile))
+    finally:
+        shutil.rmtree(outdir, ignore_errors=True)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    print(f"\nResults appended to {args.output}")
+
+    if baseline is not None:
+        regressions = compare_to_baseline(record, baseline, args.max_slowdown)
+        if regressions:
+            sys.exit(f"Performance regressions over {args.max_slowdown}x: " + ", ".join(regressions))
+
+    if any(result["errors"] for result in record["results"]):
+        sys.exit("Some benchmark stages failed (see errors in the results file)")
+
+
+if __name__ == "__main__":
+    main()
@@ -40,7 +40,9 @@ window.DASHBOARD_CONFIG = {
         'current': 3,  // This Month
         'next': 4,     // Next Month
         'third': 5,    // Third Month
-        'calendar': 6  // Calendar
+        'fourth': 6,   // Fourth Month
+        'calendar': 7, // Calendar
+        'year': 8      // Year at a Glance
     },
     
     // Raspberry Pi Performance Settings
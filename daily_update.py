@@ -10,7 +10,7 @@ Usage:
 
 This script will:
 1. Generate a "Happening Today" chart for the current day (midnight to 11:59 PM)
-2. Remove old daily charts that are no longer current
+2. Archive old daily charts to archive/*.zip (flex_gantt's --keep-days retention)
 3. Optimize images for dashboard display
 4. Update the slides manifest
 
@@ -48,42 +48,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def cleanup_old_daily_charts():
-    """Remove old daily chart files that are not from today."""
-    try:
-        slides_dir = Path("slides")
-        if not slides_dir.exists():
-            logger.info("Slides directory does not exist, nothing to clean up")
-            return
-        
-        # Get all daily chart files
-        daily_charts = list(slides_dir.glob("gantt_daily_*.png"))
-        
-        if not daily_charts:
-            logger.info("No existing daily charts to clean up")
-            return
-        
-        # Get today's date for comparison
-        current_date = datetime.now()
-        today_filename = f"gantt_daily_{current_date.strftime('%Y_%m_%d')}.png"
-        
-        # Remove old daily charts
-        removed_count = 0
-        for chart in daily_charts:
-            if chart.name != today_filename:
-                logger.info(f"Removing old daily chart: {chart.name}")
-                chart.unlink()
-                removed_count += 1
-        
-        if removed_count > 0:
-            logger.info(f"Cleaned up {removed_count} old daily chart(s)")
-        else:
-            logger.info("No old daily charts to remove")
-            
-    except Exception as e:
-        logger.error(f"Error cleaning up old daily charts: {e}")
-
-
 def run_daily_update():
     """Run the flex_gantt script with daily mode."""
     try:
@@ -94,9 +58,6 @@ def run_daily_update():
             logger.error(f"Pipeline file not found: {pipeline_file}")
             return False
         
-        # Clean up old daily charts before generating new one
-        cleanup_old_daily_charts()
-        
         # Run the flex_gantt script with daily mode
         cmd = [
             "python3", 
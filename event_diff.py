@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+event_diff.py
+-------------
+Compare two loads of the pipeline workbook event by event.
+
+Unchanged rows are paired first by a hash of the whole row. The remaining events
+are matched by a stable identity: the "(Do Not Modify) Opportunity" row ID
+when both revisions carry one for every row, otherwise Event Name + Event Start
+Date + Owner. Without row IDs, events that did not match exactly are matched
+again on Name + Owner (rescheduled) and then on Name + Start (reassigned).
+
+Every match is a hash join (pandas merge on hashed key columns), so diffing the
+full sheet costs a few vectorized passes rather than a row-by-row comparison.
+
+Each changed event is classified as one of:
+- added: only in the new revision
+- removed: only in the old revision
+- rescheduled: start or end date moved
+- reassigned: owner changed
+- modified: any other column changed (name, status, revenue, ...)
+
+affected_ranges() collapses the old and new dates of every change into merged
+date ranges; flex_gantt.py uses them to decide which slides must be rebuilt.
+
+Usage
+-----
+python event_diff.py old_pipeline.xlsx pipeline.xlsx
+"""
+import sys
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ID_COLUMN = "(Do Not Modify) Opportunity"
+NAME_COLUMN = "Event Name"
+START_COLUMN = "Event Start Date"
+END_COLUMN = "Event End Date"
+OWNER_COLUMN = "Owner"
+
+CHANGE_TYPES = ["added", "removed", "rescheduled", "reassigned", "modified"]
+DIFF_COLUMNS = ["change", "event", "owner_old", "owner_new", "start_old", "start_new", "end_old", "end_new"]
+
+
+def source_columns(old_df: pd.DataFrame, new_df: pd.DataFrame) -> list[str]:
+    """Workbook columns present in both frames (derived '_' columns are ignored)."""
+    return [c for c in new_df.columns if c in old_df.columns and not str(c).startswith("_")]
+
+
+def has_row_ids(df: pd.DataFrame, id_column: str = ID_COLUMN) -> bool:
+    """True if every row carries a row ID."""
+    return id_column in df.columns and df[id_column].notna().all()
+
+
+def _prepare(df: pd.DataFrame, columns: list[str], id_column: str) -> pd.DataFrame:
+    """Identity columns plus a hash of the full row and the row's position."""
+    keep = [c for c in (id_column, NAME_COLUMN, START_COLUMN, END_COLUMN, OWNER_COLUMN) if c in df.columns]
+    frame = df[keep].reset_index(drop=True)
+    frame["_hash"] = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+    frame["_pos"] = np.arange(len(frame))
+    return frame
+
+
+def _with_keys(frame: pd.DataFrame, key_columns: tuple) -> pd.DataFrame:
+    """Add a hashed key and an occurrence number so duplicate keys pair up in order."""
+    key = pd.util.hash_pandas_object(frame[list(key_columns)], index=False).to_numpy()
+    occurrence = pd.Series(key).groupby(key).cumcount().to_numpy()
+    return frame.assign(_key=key, _occ=occurrence)
+
+
+def _join(old: pd.DataFrame, new: pd.DataFrame, key_columns: tuple) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Hash-join on key_columns; return (matched pairs, unmatched old, unmatched new)."""
+    pairs = _with_keys(old, key_columns).merge(
+        _with_keys(new, key_columns), on=["_key", "_occ"], suffixes=("_old", "_new"))
+    old_rest = old[~old["_pos"].isin(pairs["_pos_old"])]
+    new_rest = new[~new["_pos"].isin(pairs["_pos_new"])]
+    return pairs, old_rest, new_rest
+
+
+def _differs(old: pd.Series, new: pd.Series) -> np.ndarray:
+    """Element-wise inequality where two missing values count as equal."""
+    return (~((old == new) | (old.isna() & new.isna()))).to_numpy()
+
+
+def diff_events(old_df: pd.DataFrame, new_df: pd.DataFrame, id_column: str = ID_COLUMN) -> pd.DataFrame:
+    """
+    Return one row per changed event with its old and new owner and dates.
+
+    Columns: change, event, owner_old, owner_new, start_old, start_new,
+    end_old, end_new. Unchanged events are omitted.
+    """
+    columns = source_columns(old_df, new_df)
+    old = _prepare(old_df, columns, id_column)
+    new = _prepare(new_df, columns, id_column)
+
+    # Identical rows pair up first, so duplicate keys don't pair an unchanged row with an edited one
+    if has_row_ids(old_df, id_column) and has_row_ids(new_df, id_column):
+        passes = [("_hash",), (id_column,)]
+    else:
+        passes = [("_hash",), (NAME_COLUMN, START_COLUMN, OWNER_COLUMN),
+                  (NAME_COLUMN, OWNER_COLUMN), (NAME_COLUMN, START_COLUMN)]
+
+    matched = []
+    for key_columns in passes:
+        pairs, old, new = _join(old, new, key_columns)
+        matched.append(pairs)
+    pairs = pd.concat(matched, ignore_index=True)
+    pairs = pairs[pairs["_hash_old"] != pairs["_hash_new"]]
+
+    moved = (_differs(pairs[f"{START_COLUMN}_old"], pairs[f"{START_COLUMN}_new"])
+             | _differs(pairs[f"{END_COLUMN}_old"], pairs[f"{END_COLUMN}_new"]))
+    reassigned = _differs(pairs[f"{OWNER_COLUMN}_old"], pairs[f"{OWNER_COLUMN}_new"])
+    pairs = pairs.assign(change=np.select([moved, reassigned], ["rescheduled", "reassigned"], "modified"))
+
+    removed = old.add_suffix("_old").assign(change="removed")
+    added = new.add_suffix("_new").assign(change="added")
+    changes = pd.concat([pairs, removed, added], ignore_index=True)
+
+    diff = pd.DataFrame({
+        "change": pd.Categorical(changes["change"], categories=CHANGE_TYPES),
+        "event": changes.get(f"{NAME_COLUMN}_new").fillna(changes.get(f"{NAME_COLUMN}_old")),
+        "owner_old": changes.get(f"{OWNER_COLUMN}_old"),
+        "owner_new": changes.get(f"{OWNER_COLUMN}_new"),
+        "start_old": changes.get(f"{START_COLUMN}_old"),
+        "start_new": changes.get(f"{START_COLUMN}_new"),
+        "end_old": changes.get(f"{END_COLUMN}_old"),
+        "end_new": changes.get(f"{END_COLUMN}_new"),
+    }, columns=DIFF_COLUMNS)
+    return diff.sort_values(["change", "start_new", "start_old"], kind="stable").reset_index(drop=True)
+
+
+def affected_ranges(diff: pd.DataFrame) -> pd.DataFrame:
+    """
+    Merge the old and new date spans of every change into non-overlapping ranges.
+
+    Returns a DataFrame with 'start' and 'end' columns, sorted by start. Events
+    without an end date count as single-day events.
+    """
+    spans = pd.DataFrame({
+        "start": pd.concat([diff["start_old"], diff["start_new"]], ignore_index=True),
+        "end": pd.concat([diff["end_old"], diff["end_new"]], ignore_index=True),
+    }).dropna(subset=["start"])
+    if spans.empty:
+        return pd.DataFrame({"start": pd.Series(dtype="datetime64[ns]"), "end": pd.Series(dtype="datetime64[ns]")})
+
+    spans["start"] = pd.to_datetime(spans["start"])
+    spans["end"] = pd.to_datetime(spans["end"]).fillna(spans["start"])
+    spans["end"] = spans[["start", "end"]].max(axis=1)
+    spans = spans.sort_values("start", kind="stable")
+
+    # A new range starts wherever a span begins after every earlier span has ended
+    reach = spans["end"].cummax().shift()
+    group = (spans["start"] > reach).cumsum()
+    return spans.groupby(group).agg(start=("start", "min"), end=("end", "max")).reset_index(drop=True)
+
+
+def ranges_overlap(ranges: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> bool:
+    """True if any range overlaps [start, end]."""
+    return bool(((ranges["start"] <= end) & (ranges["end"] >= start)).any())
+
+
+def summarize_diff(diff: pd.DataFrame) -> str:
+    """One-line summary such as '2 rescheduled, 1 added' (for logs and commit messages)."""
+    counts = diff["change"].value_counts()
+    parts = [f"{counts[change]} {change}" for change in CHANGE_TYPES if counts.get(change, 0)]
+    return ", ".join(parts) if parts else "no event changes"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="List event changes between two pipeline workbooks.")
+    ap.add_argument("old_workbook", type=Path, help="Earlier revision of the workbook")
+    ap.add_argument("new_workbook", type=Path, help="Later revision of the workbook")
+    ap.add_argument("--sheet", default="Marriott Marquis Pipeline",
+                    help="Worksheet name (default: 'Marriott Marquis Pipeline')")
+    args = ap.parse_args()
+
+    frames = []
+    for workbook in (args.old_workbook, args.new_workbook):
+        if not workbook.exists():
+            sys.exit(f"Workbook not found: {workbook}")
+        df = pd.read_excel(workbook, sheet_name=args.sheet)
+        df[START_COLUMN] = pd.to_datetime(df[START_COLUMN])
+        df[END_COLUMN] = pd.to_datetime(df[END_COLUMN])
+        frames.append(df)
+
+    diff = diff_events(*frames)
+    print(f"{summarize_diff(diff)}\n")
+    for row in diff.itertuples(index=False):
+        when_old = f"{row.start_old:%Y-%m-%d}" if pd.notna(row.start_old) else "-"
+        when_new = f"{row.start_new:%Y-%m-%d}" if pd.notna(row.start_new) else "-"
+        owner = row.owner_new if pd.notna(row.owner_new) else row.owner_old
+        if row.change == "reassigned":
+            owner = f"{row.owner_old} -> {row.owner_new}"
+        print(f"  {row.change:<12} {when_old:>10} -> {when_new:<10} {owner:<30} {row.event}")
+
+    ranges = affected_ranges(diff)
+    if not ranges.empty:
+        print("\nAffected date ranges:")
+        for row in ranges.itertuples(index=False):
+            print(f"  {row.start:%Y-%m-%d} - {row.end:%Y-%m-%d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,23 @@ Now supports rolling 4-month window for automatic dashboard updates and calendar
 Features:
 - Automatic event filtering for all charts: "Marriott In-House Events 2025" events are excluded from all views
 - ICW event filtering for monthly charts only (ICW events excluded from monthly views but included in weekly/daily for complete visibility)
+- Filter rules live in event_filters.json (per-view include/exclude patterns, evaluated once per workbook load)
 - Color-coded bars by sales team member (Darren=Green, Dylan=Orange, Sarah=Pink, Eder=Purple, David=Blue)
 - Enhanced visual styling with larger titles, better fonts, and professional appearance
 - Sales team legend automatically generated
 - Rolling 4-month window with automatic cleanup of old charts
+- Retention for dated daily/weekly slides: expired charts are archived to archive/*.zip, outside the published slides/ (--keep-days/--keep-weeks/--archive-dir)
 - Daily charts with hourly granularity for precise timing
 - Professional calendar views with event placement and owner color coding
+- Year-at-a-glance heat strip (--year-overview): events per day for all 12 months, colored by each day's busiest owner
+- Per-run timing record (load, filter, figure build, savefig, optimize, manifest, peak RSS) in logs/flex_gantt_timings.jsonl
+- Incremental dashboard optimization: only new or changed slides are re-encoded (tracked in slides/.optimized.json)
+- Content-addressed slides.json (SHA-256, size, dimensions per slide), rewritten only when slides change
+- Lossless WebP (and optional near-lossless AVIF) copies of each slide, listed in slides.json so kiosks fetch the smallest format they can decode (--formats)
+- Watch mode (--watch): polls the workbook and re-renders only the daily/weekly/month/calendar/year-overview slides whose windows contain changed rows
+- Render profiles (--profile): 300 dpi "print" output, or kiosk-native 720p/1080p/4K slides (1080p is the --dashboard default)
+- Render-skip cache: charts whose inputs (rows, window, today marker, style, dpi) are unchanged are not redrawn (--force redraws)
+- Parsed-workbook cache keyed by workbook content hash and sheet, so repeat runs skip openpyxl (disable with --no-cache)
 
 Usage examples
 --------------
@@ -36,30 +47,68 @@ python flex_gantt.py pipeline.xlsx --rolling-window --dashboard
 # Generate calendar view for current month
 python flex_gantt.py pipeline.xlsx --calendar --dashboard
 
+# Calendar views for January–June 2026 from one workbook load, 4 at a time
+python flex_gantt.py pipeline.xlsx --calendar --months 1 2 3 4 5 6 --year 2026 --outdir ./calendars_2026 --jobs 4
+
+# 12-month overview of this year's events per day (or of a given year: --year-overview 2026)
+python flex_gantt.py pipeline.xlsx --year-overview --dashboard
+
 # Happening This Week chart (current week Monday to Sunday)
 python flex_gantt.py pipeline.xlsx --weekly --dashboard
 
 # Happening Today chart (current day with hourly granularity)
 python flex_gantt.py pipeline.xlsx --daily --dashboard
+
+# Everything above (today, this week, rolling window, calendar, year overview) from a single workbook load
+python flex_gantt.py pipeline.xlsx --all --dashboard
+
+# Same, rendering the charts across 4 worker processes
+python flex_gantt.py pipeline.xlsx --all --dashboard --jobs 4
+
+# Full-size 300 dpi slides instead of the 1920x1080 kiosk default
+python flex_gantt.py pipeline.xlsx --all --dashboard --profile print
+
+# Also publish AVIF slides alongside the PNG and WebP copies
+python flex_gantt.py pipeline.xlsx --all --dashboard --formats webp avif
+
+# Keep running and re-render only the slides affected by edits to the workbook
+python flex_gantt.py pipeline.xlsx --watch --dashboard
 """
 import sys
 import argparse
 import calendar
 import json
 import glob
+import re
+import hashlib
+import time
+import zipfile
+from contextlib import contextmanager
 from pathlib import Path
 from urllib.parse import unquote
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dateutil.relativedelta import relativedelta
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.colors import to_rgb
 import matplotlib.patches as patches
 from matplotlib.patches import Rectangle
-from PIL import Image
+from matplotlib.collections import PatchCollection
+from matplotlib.transforms import Bbox
+from PIL import Image, PngImagePlugin
 import os
 
+from event_diff import diff_events, affected_ranges, ranges_overlap, summarize_diff
+
+try:
+    import resource  # Unix only; used for peak-RSS reporting
+except ImportError:
+    resource = None
+
 
 def month_str_to_int(s: str) -> int:
     """Convert '7', 'Jul', 'July', etc. → 7  (raise ValueError if invalid)."""
@@ -131,7 +180,8 @@ def get_current_day() -> tuple[pd.Timestamp, pd.Timestamp]:
 def cleanup_old_charts(outdir: Path, current_months: list[int], current_years: list[int], preserve_weekly: bool = True, preserve_daily: bool = True) -> None:
     """
     Remove chart files that are not in the current 4-month rolling window.
-    Optionally preserves the weekly and daily charts.
+    Optionally preserves the weekly and daily charts (their history is bounded
+    separately by apply_retention()).
     """
     # Get all gantt chart files
     chart_files = list(outdir.glob("gantt_*.png"))
@@ -197,6 +247,75 @@ def cleanup_old_calendars(outdir: Path) -> None:
         print("No old calendar files to remove")
 
 
+# Retention for the dated daily/weekly slides (0 = keep everything).
+# Expired charts are moved into per-month zip bundles under ARCHIVE_DIR, which sits
+# outside slides/ so the bundles are not published (or committed by `git add slides/`).
+DAILY_RETENTION_DAYS = 1    # Today's chart only
+WEEKLY_RETENTION_WEEKS = 1  # This week's chart only
+ARCHIVE_DIR = Path("archive")
+
+
+def chart_date(chart_file: Path) -> pd.Timestamp:
+    """Date encoded in a gantt_daily_/gantt_weekly_ filename, or None if it has none."""
+    match = re.search(r"_(\d{4})_(\d{2})_(\d{2})\.png$", chart_file.name)
+    if not match:
+        return None
+    try:
+        return pd.Timestamp(int(match[1]), int(match[2]), int(match[3]))
+    except ValueError:
+        return None
+
+
+def apply_retention(outdir: Path, keep_days: int = DAILY_RETENTION_DAYS,
+                    keep_weeks: int = WEEKLY_RETENTION_WEEKS, archive_dir: Path = ARCHIVE_DIR) -> None:
+    """
+    Archive daily charts older than keep_days and weekly charts older than keep_weeks.
+    
+    Expired files are appended to archive_dir/slides_YYYY_MM.zip (by chart date) and
+    removed from the live directory, so every glob, optimize pass and manifest
+    only sees the current window.
+    """
+    today = pd.Timestamp(datetime.now().date())
+    expired = []
+    
+    if keep_days > 0:
+        cutoff = today - pd.Timedelta(days=keep_days - 1)
+        for chart_file in outdir.glob("gantt_daily_*.png"):
+            date = chart_date(chart_file)
+            if date is not None and date < cutoff:
+                expired.append((chart_file, date))
+    
+    if keep_weeks > 0:
+        week_start, _ = get_current_week()
+        cutoff = week_start - pd.Timedelta(weeks=keep_weeks - 1)
+        for chart_file in outdir.glob("gantt_weekly_*.png"):
+            date = chart_date(chart_file)
+            if date is not None and date < cutoff:
+                expired.append((chart_file, date))
+    
+    if not expired:
+        print("No expired daily/weekly charts to archive")
+        return
+    
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Group by month so each bundle is opened once
+    bundles = {}
+    for chart_file, date in sorted(expired, key=lambda item: item[0].name):
+        bundles.setdefault(archive_dir / f"slides_{date.strftime('%Y_%m')}.zip", []).append(chart_file)
+    
+    for bundle, chart_files in bundles.items():
+        with zipfile.ZipFile(bundle, "a", compression=zipfile.ZIP_DEFLATED) as archive:
+            archived = set(archive.namelist())
+            for chart_file in chart_files:
+                if chart_file.name not in archived:
+                    archive.write(chart_file, arcname=chart_file.name)
+        # Only delete once the bundle has been closed successfully
+        for chart_file in chart_files:
+            chart_file.unlink()
+        print(f"Archived {len(chart_files)} chart(s) to {bundle}")
+
+
 def parse_args() -> argparse.Namespace:
     ap = argparse.ArgumentParser(description="Create monthly Gantt charts and calendar views.")
     ap.add_argument("workbook", help="Path to the Excel workbook")
@@ -232,7 +351,16 @@ def parse_args() -> argparse.Namespace:
     ap.add_argument(
         "--calendar",
         action="store_true",
-        help="Generate calendar view for current month",
+        help="Generate calendar view for current month (or, with --months, for those months of --year)",
+    )
+    ap.add_argument(
+        "--year-overview",
+        type=int,
+        nargs="?",
+        const=datetime.now().year,
+        default=None,
+        metavar="YEAR",
+        help="Generate a 12-month heat strip of events per day for YEAR (default: the current year)",
     )
     ap.add_argument(
         "--weekly",
@@ -244,75 +372,711 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Generate 'Happening Today' chart for current day (midnight to 11:59 PM)",
     )
+    ap.add_argument(
+        "--all",
+        action="store_true",
+        help="Render today, this week, the rolling 4-month window, the current calendar and this year's overview in one run",
+    )
+    ap.add_argument(
+        "--watch",
+        action="store_true",
+        help="Render all dashboard slides, then keep running and re-render only the slides affected by workbook edits",
+    )
+    ap.add_argument(
+        "--watch-interval",
+        type=float,
+        default=WATCH_INTERVAL_SECONDS,
+        help=f"Seconds between workbook checks in --watch mode (default {WATCH_INTERVAL_SECONDS:g})",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Render charts and optimize slides across N worker processes (default 1 = serial; 0 = one per CPU core)",
+    )
+    ap.add_argument(
+        "--keep-days",
+        type=int,
+        default=DAILY_RETENTION_DAYS,
+        help=f"Dashboard mode: keep this many days of daily charts, archiving older ones (default {DAILY_RETENTION_DAYS}; 0 = keep all)",
+    )
+    ap.add_argument(
+        "--keep-weeks",
+        type=int,
+        default=WEEKLY_RETENTION_WEEKS,
+        help=f"Dashboard mode: keep this many weeks of weekly charts, archiving older ones (default {WEEKLY_RETENTION_WEEKS}; 0 = keep all)",
+    )
+    ap.add_argument(
+        "--archive-dir",
+        type=Path,
+        default=ARCHIVE_DIR,
+        help=f"Dashboard mode: directory for the zip bundles of expired daily/weekly charts (default {ARCHIVE_DIR}/; keep it outside slides/)",
+    )
+    ap.add_argument(
+        "--rules",
+        type=Path,
+        default=None,
+        help=f"Event filter rules JSON (default: {FILTER_RULES_PATH.name} next to this script)",
+    )
+    ap.add_argument(
+        "--timings-log",
+        type=Path,
+        default=TIMINGS_LOG_PATH,
+        help=f"Append a JSON-lines timing record for this run here (default {TIMINGS_LOG_PATH})",
+    )
+    ap.add_argument(
+        "--profile",
+        choices=sorted(RENDER_PROFILES),
+        default=None,
+        help=f"Render profile: 'print' = 300 dpi cropped to content, 'kiosk-*' = exact display resolution "
+             f"(default: {DASHBOARD_PROFILE} with --dashboard, otherwise {DEFAULT_PROFILE})",
+    )
+    ap.add_argument(
+        "--formats",
+        nargs="*",
+        choices=sorted(SLIDE_VARIANT_FORMATS),
+        default=list(DEFAULT_SLIDE_FORMATS),
+        help="Dashboard mode: also write each slide in these formats and list them in slides.json "
+             "(default: webp; AVIF needs Pillow built with libavif; pass --formats alone for PNG only)",
+    )
+    ap.add_argument(
+        "--force",
+        action="store_true",
+        help="Redraw every chart even if its inputs match the fingerprint stored in the existing PNG",
+    )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always re-parse the workbook instead of using the parsed-events cache ({EVENTS_CACHE_DIRNAME}/)",
+    )
     return ap.parse_args()
 
 
-def load_events(workbook: Path, sheet_name: str) -> pd.DataFrame:
-    """Read and tidy the sheet."""
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Parsed workbooks are cached here (next to the workbook) keyed by content hash + sheet
+EVENTS_CACHE_DIRNAME = ".flex_gantt_cache"
+EVENTS_CACHE_VERSION = 2  # Bump when load_events() changes what it stores
+
+# Running maximum of Event End Date over the start-sorted rows (interval index for window queries)
+MAX_END_COLUMN = "_max_end"
+
+
+def events_cache_sheet_hash(sheet_name: str) -> str:
+    """Short hash of the sheet name and cache version, the second part of a cache file's name."""
+    return hashlib.sha256(f"{EVENTS_CACHE_VERSION}:{sheet_name}".encode()).hexdigest()[:8]
+
+
+def events_cache_path(workbook: Path, sheet_name: str) -> Path:
+    """Cache file for a workbook/sheet pair; the name changes whenever the workbook's bytes do."""
+    workbook_hash = file_sha256(workbook)[:16]
+    sheet_hash = events_cache_sheet_hash(sheet_name)
+    return workbook.parent / EVENTS_CACHE_DIRNAME / f"{workbook.stem}.{sheet_hash}.{workbook_hash}.pkl"
+
+
+def load_events(workbook: Path, sheet_name: str, use_cache: bool = True,
+                rules: list[dict] = None) -> pd.DataFrame:
+    """
+    Read and tidy the sheet, reusing the parsed frame when the workbook is unchanged.
+    
+    Filter rules (default: event_filters.json) are evaluated after the cache so
+    rule edits take effect without re-parsing the workbook.
+    """
+    if rules is None:
+        rules = load_filter_rules()
+    cache_path = events_cache_path(workbook, sheet_name) if use_cache else None
+    
+    if cache_path is not None and cache_path.exists():
+        try:
+            return apply_filter_rules(pd.read_pickle(cache_path), rules)
+        except Exception as e:
+            # Stale/corrupt cache (e.g. written by a different pandas) - fall through and re-parse
+            print(f"Warning: Ignoring unreadable events cache {cache_path.name}: {e}")
+    
     df = pd.read_excel(workbook, sheet_name=sheet_name)
     df["Event Start Date"] = pd.to_datetime(df["Event Start Date"])
     df["Event End Date"] = pd.to_datetime(df["Event End Date"])
     df.sort_values("Event Start Date", inplace=True)
+    # Non-decreasing by construction, so it can be binary-searched (see events_in_window)
+    df[MAX_END_COLUMN] = df["Event End Date"].fillna(pd.Timestamp.min).cummax()
+    
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Drop older revisions of this workbook/sheet before writing the new one (the
+            # pattern is built from its parts: workbook stems may contain dots themselves)
+            sheet_hash = events_cache_sheet_hash(sheet_name)
+            for stale in cache_path.parent.glob(f"{glob.escape(workbook.stem)}.{sheet_hash}.*.pkl"):
+                stale.unlink()
+            # Write-then-rename so concurrent cron jobs never read a partial file
+            tmp_path = cache_path.with_suffix(f".tmp{os.getpid()}")
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write events cache: {e}")
+    
+    return apply_filter_rules(df, rules)
+
+
+# Views that filter rules can target
+FILTER_VIEWS = ("month", "week", "day", "calendar")
+
+# Rule config shipped next to this script; DEFAULT_FILTER_RULES is used if it is missing
+FILTER_RULES_PATH = Path(__file__).with_name("event_filters.json")
+DEFAULT_FILTER_RULES = [
+    {"name": "icw", "label": "ICW", "patterns": ["ICW"],
+     "action": "exclude", "views": ["month", "calendar"]},
+    {"name": "marriott_in_house", "label": "Marriott In-House", "patterns": ["Marriott In-House Events 2025"],
+     "action": "exclude", "views": ["month", "week", "day", "calendar"]},
+]
+
+
+def load_filter_rules(path: Path = None) -> list[dict]:
+    """Load and validate filter rules from JSON (see event_filters.json for the format)."""
+    if path is None:
+        if not FILTER_RULES_PATH.exists():
+            return DEFAULT_FILTER_RULES
+        path = FILTER_RULES_PATH
+    
+    with open(path) as f:
+        rules = json.load(f).get("rules", [])
+    
+    for rule in rules:
+        if not rule.get("name") or not rule.get("patterns"):
+            raise ValueError(f"Filter rule needs 'name' and 'patterns': {rule}")
+        if rule.get("action", "exclude") not in ("exclude", "include"):
+            raise ValueError(f"Filter rule '{rule['name']}' has unknown action: {rule['action']}")
+        unknown_views = set(rule.get("views", FILTER_VIEWS)) - set(FILTER_VIEWS)
+        if unknown_views:
+            raise ValueError(f"Filter rule '{rule['name']}' has unknown views: {sorted(unknown_views)}")
+    return rules
+
+
+def compile_filter_rule(rule: dict) -> re.Pattern:
+    """Compile all of a rule's patterns into a single case-insensitive regex."""
+    patterns = rule["patterns"] if rule.get("regex") else [re.escape(p) for p in rule["patterns"]]
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+def apply_filter_rules(df: pd.DataFrame, rules: list[dict]) -> pd.DataFrame:
+    """
+    Evaluate every rule once, storing a boolean column per rule (_rule_<name>) and
+    per view (_show_<view>), so renderers select precomputed masks instead of
+    re-scanning event names. The rules themselves are kept in df.attrs, which
+    travels with row slices, for reporting.
+    """
+    show = {view: pd.Series(True, index=df.index) for view in FILTER_VIEWS}
+    
+    for rule in rules:
+        column = rule.get("column", "Event Name")
+        matches = df[column].astype("string").str.contains(compile_filter_rule(rule), na=False)
+        df[f"_rule_{rule['name']}"] = matches
+        
+        for view in rule.get("views", FILTER_VIEWS):
+            if rule.get("action", "exclude") == "exclude":
+                show[view] &= ~matches
+            else:
+                show[view] &= matches
+    
+    for view, mask in show.items():
+        df[f"_show_{view}"] = mask
+    df.attrs["filter_rules"] = rules
     return df
 
 
-def optimize_image_for_dashboard(image_path: Path) -> None:
-    """Optimize PNG for dashboard: convert to 8-bit indexed color and strip metadata."""
+def visible_events(window: pd.DataFrame, view: str) -> pd.DataFrame:
+    """Rows of an event window that the filter rules allow in the given view."""
+    if f"_show_{view}" not in window.columns:
+        # Frame not produced by load_events() - evaluate the default rules now
+        window = apply_filter_rules(window.copy(), load_filter_rules())
+    return window.loc[window[f"_show_{view}"]]
+
+
+def filter_report(window: pd.DataFrame, view: str) -> tuple[list[tuple[str, int]], list[str]]:
+    """
+    Summarize filtering for a view's log line.
+    
+    Returns ([(label, matching events excluded), ...], [labels of rules not applied to this view]).
+    """
+    rules = window.attrs.get("filter_rules") or load_filter_rules()
+    excluded, ignored = [], []
+    for rule in rules:
+        label = rule.get("label", rule["name"])
+        if view not in rule.get("views", FILTER_VIEWS):
+            ignored.append(label)
+        elif rule.get("action", "exclude") == "exclude":
+            column = f"_rule_{rule['name']}"
+            count = int(window[column].sum()) if column in window.columns else 0
+            excluded.append((label, count))
+    return excluded, ignored
+
+
+def events_in_window(df: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """
+    Rows whose [Event Start Date, Event End Date] overlaps [start, end].
+    
+    Frames from load_events() (and any row subset of them that keeps the start
+    order) carry MAX_END_COLUMN, so the candidate range is found with two
+    binary searches: rows past searchsorted(start dates, end) start too late,
+    and rows before searchsorted(running max end, start) all ended too early.
+    Only the rows in between are checked individually.
+    """
+    if MAX_END_COLUMN not in df.columns:
+        return df.loc[(df["Event Start Date"] <= end) & (df["Event End Date"] >= start)]
+    
+    lo = df[MAX_END_COLUMN].searchsorted(start, side="left")
+    hi = df["Event Start Date"].searchsorted(end, side="right")
+    candidates = df.iloc[lo:hi]
+    return candidates.loc[candidates["Event End Date"] >= start]
+
+
+def event_occupancy(events: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.Series:
+    """
+    Number of events on each day from start to end (inclusive), indexed by date.
+    
+    Each event adds +1 on the first window day it covers and -1 on the day after
+    its last; the cumulative sum of that difference array is every day's count,
+    so the cost is O(events + days) however long the events run. Events without
+    dates, outside the window, or ending before they start count nowhere.
+    """
+    days, dated, first, last = _window_day_offsets(events, start, end)
+
+    delta = np.zeros(len(days) + 1, dtype=int)
+    np.add.at(delta, first, 1)
+    np.add.at(delta, last + 1, -1)
+    return pd.Series(np.cumsum(delta[:-1]), index=days, name="events")
+
+
+def owner_occupancy(events: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """
+    Number of each owner's events on each day from start to end (inclusive).
+
+    Returns a date-indexed frame with one column per owner ('' for unassigned
+    events). The +1/-1 boundaries of event_occupancy() are summed per (day, owner)
+    in a single groupby and accumulated down each column, so a whole year of
+    per-owner counts costs one pass over the events.
+    """
+    days, dated, first, last = _window_day_offsets(events, start, end)
+    owners = dated["Owner"].fillna("").astype(str).str.strip() if "Owner" in dated.columns \
+        else pd.Series("", index=dated.index)
+    owners = owners.to_numpy()
+
+    deltas = pd.DataFrame({
+        "day": np.concatenate([first, last + 1]),
+        "owner": np.concatenate([owners, owners]),
+        "delta": np.repeat([1, -1], len(first)),
+    })
+    counts = deltas.groupby(["day", "owner"])["delta"].sum().unstack(fill_value=0)
+    counts = counts.reindex(range(len(days) + 1), fill_value=0).cumsum().iloc[:-1]
+    counts.index = days
+    counts.columns.name = None
+    return counts
+
+
+def _window_day_offsets(events: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> tuple:
+    """
+    Days of the window plus, for the dated events that overlap it, the rows and
+    their first and last covered day as offsets into those days.
+    """
+    days = pd.date_range(start.normalize(), end.normalize(), freq="D")
+    dated = events.dropna(subset=["Event Start Date", "Event End Date"])
+    first = (dated["Event Start Date"].clip(lower=days[0]).dt.normalize() - days[0]).dt.days.to_numpy()
+    last = (dated["Event End Date"].clip(upper=end).dt.normalize() - days[0]).dt.days.to_numpy()
+    covered = (first <= last) & (first < len(days)) & (last >= 0)
+    return days, dated.loc[covered], first[covered], last[covered]
+
+
+# Modern-format copies written next to each optimized PNG slide; the PNG stays the fallback.
+# WebP is lossless; AVIF is near-lossless, with full-resolution (4:4:4) chroma so text edges stay crisp.
+SLIDE_VARIANT_FORMATS = {
+    "webp": {"format": "WEBP", "options": {"lossless": True, "method": 4}},
+    "avif": {"format": "AVIF", "options": {"quality": 90, "subsampling": "4:4:4", "speed": 6}},
+}
+DEFAULT_SLIDE_FORMATS = ("webp",)
+
+
+def encodable_formats(formats) -> list[str]:
+    """The requested variant formats this Pillow build can write."""
+    Image.init()
+    return [fmt for fmt in formats if SLIDE_VARIANT_FORMATS[fmt]["format"] in Image.SAVE]
+
+
+def variant_path(image_path: Path, fmt: str) -> Path:
+    """Path of a slide's variant in another format (gantt_2025_07.png -> gantt_2025_07.webp)."""
+    return image_path.with_suffix(f".{fmt}")
+
+
+def write_slide_variants(img: Image.Image, image_path: Path, formats) -> list[str]:
+    """Encode img in each variant format next to image_path; returns the formats written."""
+    written = []
+    for fmt in formats:
+        spec = SLIDE_VARIANT_FORMATS[fmt]
+        try:
+            img.save(variant_path(image_path, fmt), spec["format"], **spec["options"])
+            written.append(fmt)
+        except Exception as e:
+            print(f"Warning: Could not write {fmt} for {image_path.name}: {e}")
+    return written
+
+
+def backfill_slide_variants(image_path: Path, formats) -> list[str]:
+    """Write the variants an already-optimized slide is missing, from the optimized PNG."""
+    missing = [fmt for fmt in formats if not variant_path(image_path, fmt).exists()]
+    if not missing:
+        return []
     try:
         with Image.open(image_path) as img:
-            # Convert to RGB if necessary (in case of RGBA)
-            if img.mode in ('RGBA', 'LA', 'P'):
-                # Create white background for transparency
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                img = background
-            
-            # Convert to 8-bit indexed color for smaller file size
-            img = img.quantize(colors=256, method=2)  # Method 2 is median cut
-            
-            # Save optimized version, overwriting original
-            img.save(image_path, 'PNG', optimize=True, compress_level=9)
-            
-            # Get file size for reporting
-            size_kb = image_path.stat().st_size / 1024
-            print(f"Optimized {image_path.name}: {size_kb:.1f} KB")
-            
+            return write_slide_variants(img.convert('RGB'), image_path, missing)
     except Exception as e:
-        print(f"Warning: Could not optimize {image_path.name}: {e}")
+        print(f"Warning: Could not read {image_path.name}: {e}")
+        return []
+
 
+def prune_slide_variants(slides_dir: Path, formats) -> int:
+    """Delete variants whose PNG is gone (archived or cleaned up) or whose format is no longer produced."""
+    removed = 0
+    for fmt in SLIDE_VARIANT_FORMATS:
+        for variant in slides_dir.glob(f"*.{fmt}"):
+            if fmt not in formats or not variant.with_suffix(".png").exists():
+                variant.unlink()
+                removed += 1
+    return removed
 
-def generate_slides_manifest(slides_dir: Path) -> None:
-    """Generate slides.json manifest file listing all PNG slides in the directory."""
+
+def write_dashboard_png(img: Image.Image, image_path: Path, formats=(), fingerprint: str = None) -> str:
+    """Flatten img onto white, quantize it to 8-bit palette and write the PNG plus its format variants.
+
+    The render fingerprint is the one text chunk written, so unchanged charts are
+    still recognized (and skipped) on the next run. Variants in `formats` are
+    encoded from the quantized image, so every copy shows the same pixels.
+
+    Returns a one-line size report for the caller to print.
+    """
+    pnginfo = None
+    if fingerprint:
+        pnginfo = PngImagePlugin.PngInfo()
+        pnginfo.add_text(FINGERPRINT_KEY, fingerprint)
+    
+    # Convert to RGB if necessary (in case of RGBA)
+    if img.mode in ('RGBA', 'LA', 'P'):
+        # Create white background for transparency
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+        img = background
+    
+    # Convert to 8-bit indexed color for smaller file size
+    img = img.quantize(colors=256, method=2)  # Method 2 is median cut
+    
+    # Save optimized version, overwriting original
+    img.save(image_path, 'PNG', optimize=True, compress_level=9, pnginfo=pnginfo)
+    
+    # Variants share the PNG's palette pixels, which also compress far better than the anti-aliased original
+    written = write_slide_variants(img.convert('RGB'), image_path, formats)
+    
+    # Get file size for reporting
+    size_kb = image_path.stat().st_size / 1024
+    variant_sizes = "".join(
+        f", {fmt} {variant_path(image_path, fmt).stat().st_size / 1024:.1f} KB" for fmt in written)
+    return f"Optimized {image_path.name}: {size_kb:.1f} KB{variant_sizes}"
+
+
+def _optimize_file(image_path: Path, formats=()) -> tuple[bool, str]:
+    """Optimize one PNG on disk; returns (success, report line). Runs in optimization workers."""
+    try:
+        with Image.open(image_path) as img:
+            img.load()
+            return True, write_dashboard_png(img, image_path, formats, img.info.get(FINGERPRINT_KEY))
+    except Exception as e:
+        return False, f"Warning: Could not optimize {image_path.name}: {e}"
+
+
+def optimize_image_for_dashboard(image_path: Path, formats=()) -> bool:
+    """Optimize a PNG on disk for the dashboard (see write_dashboard_png).
+
+    Returns True if the image was rewritten successfully.
+    """
+    ok, message = _optimize_file(image_path, formats)
+    print(message)
+    return ok
+
+
+def optimize_images(paths: list[Path], formats=(), jobs: int = 1) -> list[Path]:
+    """
+    Optimize PNGs on disk, across up to `jobs` worker processes.
+
+    Progress is printed as each file finishes. A file that fails (or whose
+    worker dies) is reported and left as it was without stopping the rest.
+    Returns the paths that were optimized.
+    """
+    total = len(paths)
+    optimized = []
+    if jobs <= 1 or total <= 1:
+        outcomes = ((path, _optimize_file(path, formats)) for path in paths)
+        for count, (path, (ok, message)) in enumerate(outcomes, 1):
+            print(f"  [{count}/{total}] {message}")
+            if ok:
+                optimized.append(path)
+        return optimized
+    
+    workers = min(jobs, total)
+    print(f"Optimizing {total} slide(s) across {workers} worker processes...")
+    # Flush before forking so buffered output isn't duplicated by the workers
+    sys.stdout.flush()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_optimize_file, path, formats): path for path in paths}
+        for count, future in enumerate(as_completed(futures), 1):
+            path = futures[future]
+            try:
+                ok, message = future.result()
+            except Exception as e:  # e.g. a worker killed for running out of memory
+                ok, message = False, f"Warning: Could not optimize {path.name}: {e}"
+            print(f"  [{count}/{total}] {message}")
+            if ok:
+                optimized.append(path)
+    return optimized
+
+
+# Sidecar index of already-optimized slides:
+# filename -> {sha256, size, mtime_ns, variants: {format: {sha256, size, mtime_ns}}}
+# Local to each checkout (git-ignored): mtimes differ per clone, so committing it would
+# change slides/ on every scheduled run. Without it, palette PNGs are simply re-adopted.
+OPTIMIZED_INDEX_NAME = ".optimized.json"
+
+
+def load_optimized_index(slides_dir: Path) -> dict:
+    """Load the optimized-slides index, returning an empty index if missing or unreadable."""
+    index_path = slides_dir / OPTIMIZED_INDEX_NAME
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+        return index if isinstance(index, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_optimized_index(slides_dir: Path, index: dict) -> None:
+    """Write the optimized-slides index next to the slides."""
+    index_path = slides_dir / OPTIMIZED_INDEX_NAME
+    with open(index_path, 'w') as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+
+
+def indexed_sha256(path: Path, entry: dict, stat: os.stat_result = None) -> str:
+    """SHA-256 of a file, reused from its index entry while size and mtime still match."""
+    stat = stat or path.stat()
+    if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+        return entry["sha256"]
+    return file_sha256(path)
+
+
+def optimized_index_entry(image_path: Path, sha256: str = None, previous: dict = None) -> dict:
+    """
+    Build an index entry for an optimized slide and its format variants from
+    their current contents. Variant hashes are reused from the previous entry
+    while the variant's size and mtime are unchanged.
+    """
+    stat = image_path.stat()
+    variants = {}
+    previous_variants = (previous or {}).get("variants", {})
+    for fmt in SLIDE_VARIANT_FORMATS:
+        variant = variant_path(image_path, fmt)
+        if variant.exists():
+            variant_stat = variant.stat()
+            variants[fmt] = {
+                "sha256": indexed_sha256(variant, previous_variants.get(fmt), variant_stat),
+                "size": variant_stat.st_size,
+                "mtime_ns": variant_stat.st_mtime_ns,
+            }
+    return {
+        "sha256": sha256 or file_sha256(image_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "variants": variants,
+    }
+
+
+def is_already_optimized(image_path: Path, entry: dict) -> tuple[bool, str]:
+    """
+    Check whether a slide still matches its optimized-index entry.
+
+    Size and mtime are compared first so unchanged files cost a single stat();
+    the content hash is only computed when the mtime moved (e.g. after a git
+    checkout). Returns (matches, sha256 or None if no hash was computed).
+    """
+    if not entry:
+        return False, None
+    stat = image_path.stat()
+    if entry.get("size") != stat.st_size:
+        return False, None
+    if entry.get("mtime_ns") == stat.st_mtime_ns:
+        return True, entry.get("sha256")
+    sha256 = file_sha256(image_path)
+    return sha256 == entry.get("sha256"), sha256
+
+
+def is_indexed_color(image_path: Path) -> bool:
+    """True if the PNG is already 8-bit palette (our optimizer's output); reads the header only."""
+    try:
+        with Image.open(image_path) as img:
+            return img.mode == 'P'
+    except Exception:
+        return False
+
+
+def optimize_slides(slides_dir: Path, formats=DEFAULT_SLIDE_FORMATS, jobs: int = 1) -> None:
+    """
+    Optimize only the slides that are new or changed since the last run.
+
+    Charts saved as full RGBA PNGs are quantized here; anything already recorded
+    in the sidecar index or already 8-bit palette (dashboard renders are
+    quantized in memory before they are written) is left untouched, so a
+    nightly --daily run re-encodes at most one image instead of the whole
+    directory. Each slide also gets a copy in every format in `formats` (see
+    SLIDE_VARIANT_FORMATS); unchanged slides only have missing variants
+    written. A bulk re-encode is spread across `jobs` worker processes.
+    """
+    formats = encodable_formats(formats)
+    index = load_optimized_index(slides_dir)
+    updated_index = {}
+    pending = []
+    skipped_count = 0
+    
+    for png_file in sorted(slides_dir.glob("*.png")):
+        entry = index.get(png_file.name)
+        matches, sha256 = is_already_optimized(png_file, entry)
+        
+        if matches or is_indexed_color(png_file):
+            # Unchanged, or written already optimized (by the renderers in dashboard mode,
+            # or by an earlier run before the index existed)
+            skipped_count += 1
+            for fmt in backfill_slide_variants(png_file, formats):
+                print(f"Added {variant_path(png_file, fmt).name}")
+            updated_index[png_file.name] = optimized_index_entry(png_file, sha256, entry)
+            continue
+        
+        pending.append(png_file)
+    
+    optimized = optimize_images(pending, formats, jobs)
+    for png_file in optimized:
+        updated_index[png_file.name] = optimized_index_entry(png_file)
+    optimized_count = len(optimized)
+    
+    # Entries for deleted slides are dropped by rebuilding the index from disk;
+    # an unchanged index is not rewritten
+    if updated_index != index:
+        save_optimized_index(slides_dir, updated_index)
+    removed = prune_slide_variants(slides_dir, formats)
+    if removed:
+        print(f"Removed {removed} orphaned slide variant(s)")
+    print(f"Optimized {optimized_count} new/changed slide(s), skipped {skipped_count} already optimized")
+
+
+def slide_metadata(slide: Path, index_entry: dict = None) -> dict:
+    """
+    Manifest entry for one slide: SHA-256, byte size, pixel dimensions, mtime
+    and the name, hash and size of each format variant present next to it.
+    
+    Each file is stat()ed once; the slide's and its variants' hashes are reused
+    from the optimized-slides index when size and mtime still match it, and the
+    dimensions come from the PNG header without decoding the image.
+    """
+    stat = slide.stat()
+    sha256 = indexed_sha256(slide, index_entry, stat)
+    with Image.open(slide) as img:
+        width, height = img.size
+    variants = {}
+    indexed_variants = (index_entry or {}).get("variants", {})
+    for fmt in SLIDE_VARIANT_FORMATS:
+        variant = variant_path(slide, fmt)
+        if variant.exists():
+            variant_stat = variant.stat()
+            variants[fmt] = {"name": variant.name,
+                             "sha256": indexed_sha256(variant, indexed_variants.get(fmt), variant_stat),
+                             "bytes": variant_stat.st_size}
+    return {
+        "name": slide.name,
+        "sha256": sha256,
+        "bytes": stat.st_size,
+        "width": width,
+        "height": height,
+        "mtime": datetime.fromtimestamp(stat.st_mtime).isoformat(timespec="seconds"),
+        "variants": variants,
+    }
+
+
+def manifest_content_key(manifest: dict) -> str:
+    """
+    The parts of a manifest that describe slide content, for change detection.
+    
+    The generation time and file mtimes are left out: a fresh checkout or a
+    re-render that produced identical bytes must not count as a change.
+    """
+    files = [{k: v for k, v in entry.items() if k != "mtime"} for entry in manifest.get("files", [])]
+    return json.dumps({"slides": manifest.get("slides"), "files": files}, sort_keys=True)
+
+
+def generate_slides_manifest(slides_dir: Path) -> bool:
+    """
+    Generate slides.json listing all PNG slides with their hashes, dimensions
+    and format variants ('slides' stays the list of PNG names).
+    
+    The file is only rewritten when slide content changed, so an unchanged
+    manifest keeps its bytes (and its 'generated' time) and clients can cache
+    slides by hash. Returns True if the manifest was written.
+    """
     # Find all PNG files in slides directory
     png_files = list(slides_dir.glob("*.png"))
     
     if not png_files:
         print("No PNG files found in slides directory")
-        return
+        return False
     
     # Sort files by name (which should be chronological based on our naming)
     png_files.sort(key=lambda x: x.name)
     
+    index = load_optimized_index(slides_dir)
+    files = [slide_metadata(f, index.get(f.name)) for f in png_files]
+    
     # Create manifest with filenames only (relative to slides directory)
     manifest = {
-        "slides": [f.name for f in png_files],
+        "slides": [entry["name"] for entry in files],
+        "files": files,
         "generated": pd.Timestamp.now().isoformat(),
-        "count": len(png_files),
+        "count": len(files),
         "note": "Auto-generated manifest of all PNG files in slides directory"
     }
     
-    # Write manifest file
     manifest_path = slides_dir / "slides.json"
+    try:
+        with open(manifest_path) as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = None
+    
+    if previous is not None and manifest_content_key(previous) == manifest_content_key(manifest):
+        print(f"Manifest unchanged: {manifest_path} ({len(files)} slides)")
+        return False
+    
+    # Write manifest file
     with open(manifest_path, 'w') as f:
         json.dump(manifest, f, indent=2)
     
     print(f"Generated manifest: {manifest_path}")
-    print(f"Slides in playlist: {len(png_files)}")
-    for i, slide in enumerate(png_files, 1):
-        size_kb = slide.stat().st_size / 1024
-        print(f"  {i}. {slide.name} ({size_kb:.1f} KB)")
+    print(f"Slides in playlist: {len(files)}")
+    for i, entry in enumerate(files, 1):
+        size_kb = entry["bytes"] / 1024
+        variant_sizes = "".join(f", {fmt} {v['bytes'] / 1024:.1f} KB" for fmt, v in entry["variants"].items())
+        print(f"  {i}. {entry['name']} ({size_kb:.1f} KB{variant_sizes}, {entry['width']}x{entry['height']})")
+    return True
 
 
 def get_seller_color(owner: str) -> str:
@@ -349,25 +1113,246 @@ def get_seller_color(owner: str) -> str:
     return '#fde047'
 
 
-def gantt_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path, month_position: int = None) -> None:
+def seller_colors(sub: pd.DataFrame) -> np.ndarray:
+    """Bar color for every row, calling get_seller_color() once per distinct owner."""
+    if "Owner" not in sub.columns:
+        return np.full(len(sub), get_seller_color(""), dtype=object)
+    codes, owners = pd.factorize(sub["Owner"])
+    # Missing owners get code -1, which picks the trailing default color
+    palette = np.array([get_seller_color(owner) for owner in owners] + [get_seller_color("")], dtype=object)
+    return palette[codes]
+
+
+def bar_geometry(sub: pd.DataFrame, window_start: pd.Timestamp, window_end: pd.Timestamp,
+                 whole_days: bool = False) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Clip events to a chart window and compute barh inputs for all rows at once.
+    
+    Returns (starts, durations in days, colors) as NumPy arrays. With whole_days
+    the duration counts calendar days (monthly view); otherwise it is fractional
+    (weekly/daily views). Both include the end day itself, hence the +1.
+    """
+    starts = sub["Event Start Date"].clip(lower=window_start)
+    spans = sub["Event End Date"].clip(upper=window_end) - starts
+    if whole_days:
+        durations = spans.dt.days + 1
+    else:
+        durations = spans / pd.Timedelta(days=1) + 1
+    return starts.to_numpy(), durations.to_numpy(dtype=float), seller_colors(sub)
+
+
+# Render-skip cache: every chart embeds a fingerprint of its inputs in a PNG text
+# chunk, and is only redrawn when the fingerprint of the current inputs differs.
+STYLE_VERSION = 2  # Bump whenever the drawing code changes so existing charts are redrawn
+CHART_DPI = 300
+FINGERPRINT_KEY = "Render-Fingerprint"
+
+# Render profiles. "print" is the original output: 300 dpi, cropped to the chart's
+# content (6000+ px wide). Kiosk profiles fit each chart to the display's aspect
+# ratio and rasterize it at exactly the display's pixel size, so nothing is
+# downscaled later by the optimizer or the kiosk browser.
+RENDER_PROFILES = {
+    "print": {"dpi": CHART_DPI, "size": None},
+    "kiosk-720p": {"dpi": None, "size": (1280, 720)},
+    "kiosk-1080p": {"dpi": None, "size": (1920, 1080)},
+    "kiosk-4k": {"dpi": None, "size": (3840, 2160)},
+}
+DEFAULT_PROFILE = "print"
+DASHBOARD_PROFILE = "kiosk-1080p"  # Default for --dashboard slides
+
+
+def resolve_profile(profile: str, dashboard: bool) -> str:
+    """The requested profile, or the default for dashboard slides / regular output."""
+    if profile:
+        return profile
+    return DASHBOARD_PROFILE if dashboard else DEFAULT_PROFILE
+
+
+def chart_figsize(fig_w: float, fig_h: float, profile: str) -> tuple[float, float]:
+    """
+    Figure size in inches for a profile.
+    
+    Kiosk profiles widen figures that are taller than the display's aspect ratio
+    (giving bars and calendar cells the spare width); shorter figures keep their
+    size and are letterboxed by save_chart() rather than stretched.
+    """
+    size = RENDER_PROFILES[profile]["size"]
+    if size is None:
+        return fig_w, fig_h
+    return max(fig_w, fig_h * size[0] / size[1]), fig_h
+
+
+def save_chart(fig, outfile: Path, profile: str, pad_inches: float, metadata: dict,
+               optimize: bool = False, formats=()) -> None:
+    """
+    Save a chart at the profile's resolution (tight-cropped print, or the exact kiosk canvas).
+    
+    With optimize=True the figure is rendered to the Agg buffer only and handed
+    to write_dashboard_png() in memory, so a dashboard slide is encoded once as
+    the final 8-bit PNG (plus `formats` variants) instead of written as RGBA,
+    read back and rewritten.
+    """
+    settings = RENDER_PROFILES[profile]
+    if settings["size"] is None:
+        options = dict(dpi=settings["dpi"], bbox_inches='tight', pad_inches=pad_inches)
+    else:
+        # Crop to the content like print does, grow the crop to the display's aspect
+        # ratio, and pick the dpi that maps it onto exactly width x height pixels
+        width_px, height_px = settings["size"]
+        # Measure at about the output resolution so the layout pass allocates a screen-sized canvas
+        fig.set_dpi(width_px / fig.get_figwidth())
+        fig.draw_without_rendering()
+        bbox = fig.get_tightbbox().padded(pad_inches)
+        crop_w = max(bbox.width, bbox.height * width_px / height_px)
+        crop_h = crop_w * height_px / width_px
+        crop = Bbox.from_bounds(bbox.x0 - (crop_w - bbox.width) / 2, bbox.y0 - (crop_h - bbox.height) / 2,
+                                crop_w, crop_h)
+        options = dict(dpi=width_px / crop_w, bbox_inches=crop)
+    
+    if not optimize:
+        fig.savefig(outfile, facecolor='#f8fafc', edgecolor='none', metadata=metadata, **options)
+        return
+    
+    # Raw RGBA output only draws into the canvas; the bytes it streams are discarded
+    # and the cropped render is read straight from the Agg buffer
+    with open(os.devnull, 'wb') as sink:
+        fig.savefig(sink, format='rgba', facecolor='#f8fafc', edgecolor='none', **options)
+    img = Image.fromarray(np.asarray(fig.canvas.buffer_rgba()))
+    print(write_dashboard_png(img, outfile, formats, metadata.get(FINGERPRINT_KEY)))
+
+
+def render_fingerprint(sub: pd.DataFrame, profile: str, *inputs) -> str:
+    """SHA-256 of the rows a chart draws plus the window, today marker, style and profile."""
+    columns = [c for c in sub.columns if not str(c).startswith("_")]
+    digest = hashlib.sha256()
+    digest.update(pd.util.hash_pandas_object(sub[columns], index=False).to_numpy().tobytes())
+    digest.update(repr((STYLE_VERSION, RENDER_PROFILES[profile], columns) + inputs).encode())
+    return digest.hexdigest()
+
+
+def chart_is_current(outfile: Path, fingerprint: str) -> bool:
+    """True if outfile exists and was rendered from inputs with this fingerprint."""
+    try:
+        with Image.open(outfile) as img:
+            return img.info.get(FINGERPRINT_KEY) == fingerprint
+    except OSError:
+        return False
+
+
+def skip_if_current(outfile: Path, fingerprint: str, force: bool = False) -> bool:
+    """
+    True, after reporting it, when the chart on disk was drawn from identical inputs
+    and need not be rendered again; always False with force=True.
+    """
+    if force or not chart_is_current(outfile, fingerprint):
+        return False
+    print(f"Unchanged {outfile} (same inputs as the last render)")
+    return True
+
+
+# Shared look of the month/week/day Gantt charts, applied in bulk through rcParams
+# instead of per-label and per-spine property updates
+GANTT_STYLE = {
+    "font.family": "sans-serif",
+    "font.weight": 500,  # Tick labels and legend entries
+    "figure.facecolor": "#f8fafc",
+    "axes.facecolor": "#ffffff",
+    "axes.edgecolor": "#cbd5e1",
+    "axes.linewidth": 1.5,
+    "axes.spines.top": False,
+    "axes.spines.right": False,
+    "axes.axisbelow": True,
+    "axes.labelsize": 16,
+    "axes.labelweight": 600,
+    "axes.labelcolor": "#1e293b",
+    "axes.labelpad": 15,
+    "axes.titlesize": 28,
+    "axes.titleweight": 700,
+    "axes.titlepad": 30,
+    "xtick.labelsize": 11,
+    "ytick.labelsize": 11,
+    "legend.loc": "upper right",
+    "legend.frameon": True,
+    "legend.fancybox": True,
+    "legend.shadow": True,
+    "legend.framealpha": 0.95,
+    "legend.facecolor": "#f8fafc",
+    "legend.edgecolor": "#e2e8f0",
+    "legend.fontsize": 11,
+    "legend.title_fontsize": 13,
+    "legend.labelcolor": "#374151",
+}
+
+
+def gantt_style():
+    """Context applying matplotlib's defaults plus GANTT_STYLE while a Gantt chart is built and saved."""
+    return plt.style.context(["default", GANTT_STYLE])
+
+
+def add_sales_team_legend(ax, sub: pd.DataFrame, **legend_kwargs) -> None:
+    """Add the 'Sales Team' legend of owner colors for the owners in sub (legend_kwargs go to ax.legend)."""
+    if 'Owner' not in sub.columns:
+        return
+    handles = [Rectangle((0, 0), 1, 1, facecolor=get_seller_color(owner), edgecolor='white',
+                         linewidth=1.5, label=str(owner).strip(), alpha=0.9)
+               for owner in sorted(sub['Owner'].dropna().unique()) if str(owner).strip()]
+    if handles:
+        legend = ax.legend(handles=handles, title='Sales Team', **legend_kwargs)
+        legend.get_title().set(fontweight='600', color='#1e293b')
+
+
+def gantt_figure(sub: pd.DataFrame, starts, durations, colors, fig_h: float, profile: str,
+                 title: str, title_color: str, xlabel: str = "Date") -> tuple:
+    """
+    Create a month/week/day Gantt chart with the shared styling (call inside gantt_style()).
+    
+    Draws the event bars, axis labels, boxed title and Sales Team legend; the
+    caller adds the x-axis range, tick locators and grid. Returns (fig, ax).
+    """
+    fig_w, fig_h = chart_figsize(20.0, fig_h, profile)
+    fig, ax = plt.subplots(figsize=(fig_w, fig_h), constrained_layout=True)
+    
+    if not sub.empty:
+        ax.barh(sub["Event Name"], durations, left=starts, color=colors,
+                alpha=0.85, edgecolor='white', linewidth=1.5, height=0.7)
+    
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Events")
+    title_text = ax.set_title(title, color=title_color)
+    title_text.set_bbox(dict(boxstyle="round,pad=0.5", facecolor='#f1f5f9',
+                             alpha=0.8, edgecolor='none'))
+    
+    # Tick colors are set on the major ticks only, so minor ticks keep the default color
+    ax.tick_params(axis='y', colors='#334155', pad=8)
+    ax.tick_params(axis='x', colors='#475569', pad=5)
+    
+    add_sales_team_legend(ax, sub)
+    return fig, ax
+
+
+def gantt_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path, month_position: int = None,
+                    force: bool = False, profile: str = DEFAULT_PROFILE, optimize: bool = False,
+                    formats=()) -> Path:
     """Draw + save a single month's chart, clipping multi-month events.
     
     Args:
         month_position: Position in rolling window (0=current, 1=next, 2=third, 3=fourth) for color coding
+        force: Redraw even if the existing chart was rendered from identical inputs
+        profile: Render profile (see RENDER_PROFILES)
+        optimize: Write the dashboard-optimized PNG (and `formats` variants) directly
+    
+    Returns the chart path (None when the month has no events to draw).
     """
+    chart_started = time.perf_counter()
     mname = calendar.month_name[month]
     mstart = pd.Timestamp(year, month, 1)
     mend = pd.Timestamp(year, month, calendar.monthrange(year, month)[1])
 
     # Filter events for this month
-    mask = (df["Event Start Date"] <= mend) & (df["Event End Date"] >= mstart)
-    sub = df.loc[mask].copy()
+    window = events_in_window(df, mstart, mend)
     
-    # Filter out events containing "ICW" or "Marriott In-House Events 2025" in the name
-    icw_mask = ~sub["Event Name"].str.contains("ICW", case=False, na=False)
-    marriott_mask = ~sub["Event Name"].str.contains("Marriott In-House Events 2025", case=False, na=False)
-    combined_mask = icw_mask & marriott_mask
-    sub = sub.loc[combined_mask]
+    # Apply the monthly filter rules (by default: no ICW or Marriott In-House events)
+    sub = visible_events(window, "month")
     
     if sub.empty:
         print(f"[{mname}]  No events in sheet for this month (after filtering).")
@@ -377,86 +1362,18 @@ def gantt_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path, month
     # This will display most recent events at the top of the chart
     sub = sub.sort_values("Event Start Date", ascending=False)
 
+    # Skip the render when the chart on disk was drawn from identical inputs
+    outfile = outdir / f"gantt_{year}_{month:02d}.png"
+    today = pd.Timestamp(datetime.now().date())
+    fingerprint = render_fingerprint(sub, profile, "month", mstart, mend,
+                                     today if mstart <= today <= mend else None, month_position)
+    if skip_if_current(outfile, fingerprint, force):
+        return outfile
+
     # Clip to the month window and prepare data
-    starts, durations, colors = [], [], []
-    for _, row in sub.iterrows():
-        s = max(row["Event Start Date"], mstart)
-        e = min(row["Event End Date"], mend)
-        starts.append(s)
-        durations.append((e - s).days + 1)
-        colors.append(get_seller_color(row.get("Owner", "")))
-
-    # Enhanced plotting with modern styling
-    fig_h = max(4.0, len(sub) * 0.4 + 3.5)  # More space for better readability
-    fig_w = 20.0  # Optimal width for readability
-    
-    # Create figure with modern styling
-    plt.style.use('default')  # Reset any previous styles
-    fig, ax = plt.subplots(figsize=(fig_w, fig_h), constrained_layout=True)
-    
-    # Modern gradient background
-    fig.patch.set_facecolor('#f8fafc')
-    ax.set_facecolor('#ffffff')
-    
-    # Create the horizontal bar chart with enhanced styling
-    bars = ax.barh(sub["Event Name"], durations, left=starts, color=colors, 
-                   alpha=0.9, edgecolor='white', linewidth=1.5, height=0.7)
-    
-    # Enhanced bar styling with transparency
-    for bar, color in zip(bars, colors):
-        bar.set_alpha(0.85)
-        bar.set_linewidth(1.5)
-        bar.set_edgecolor('white')
-    
-    # Enhanced styling
-    ax.set_xlim(mstart - pd.Timedelta(hours=12), mend + pd.Timedelta(hours=36))
-    
-    # Use daily ticks to show day numbers
-    ax.xaxis.set_major_locator(mdates.DayLocator(interval=1))
-    ax.xaxis.set_major_formatter(mdates.DateFormatter("%d"))  # Just day numbers
-    
-    # Add week indicators with Monday markers (more prominent)
-    ax.xaxis.set_minor_locator(mdates.WeekdayLocator(byweekday=mdates.MO))
-    
-    # Modern grid styling with enhanced week indicators
-    ax.grid(axis="x", linestyle="-", linewidth=0.8, alpha=0.15, color='#94a3b8')  # Daily grid lines
-    ax.grid(axis="x", which='minor', linestyle="-", linewidth=2.0, alpha=0.4, color='#475569')  # Week boundaries
-    ax.set_axisbelow(True)
-    
-    # Add subtle week boundary indicators and alternating backgrounds
-    week_dates = pd.date_range(mstart, mend, freq='W-MON')
-    for i, date in enumerate(week_dates):
-        if mstart <= date <= mend:
-            # Week boundary line
-            ax.axvline(x=date, color='#334155', linewidth=2.5, alpha=0.6, zorder=1)
-            
-            # Alternating week background (every other week gets subtle shading)
-            if i % 2 == 1:
-                week_end = min(date + pd.Timedelta(days=6, hours=23, minutes=59), mend)
-                ax.axvspan(date, week_end, color='#f1f5f9', alpha=0.3, zorder=0)
-    
-    # Add current date indicator (vertical red line)
-    current_date = pd.Timestamp(datetime.now().date())
-    if mstart <= current_date <= mend:
-        # Draw a prominent red vertical line for today
-        ax.axvline(x=current_date, color='#ef4444', linewidth=3.0, alpha=0.8, zorder=10, 
-                   linestyle='-', label='Today')
-        
-        # Add a subtle red glow/shadow effect
-        ax.axvline(x=current_date, color='#ef4444', linewidth=6.0, alpha=0.2, zorder=9)
-        
-        # Optional: Add "Today" text at the top of the line
-        ax.text(current_date, ax.get_ylim()[1], 'Today', 
-                horizontalalignment='center', verticalalignment='bottom',
-                fontsize=10, color='#ef4444', fontweight='bold',
-                bbox=dict(boxstyle="round,pad=0.3", facecolor='white', 
-                         edgecolor='#ef4444', alpha=0.9))
-    
-    # Enhanced labels and title with modern typography
-    ax.set_xlabel("Date", fontsize=16, fontweight='600', color='#1e293b', 
-                  labelpad=15, fontfamily='sans-serif')
-    ax.set_ylabel("Events", fontsize=16, fontweight='600', color='#1e293b', 
-                  labelpad=15, fontfamily='sans-serif')
+    starts, durations, colors = bar_geometry(sub, mstart, mend, whole_days=True)
+
+    filter_done = time.perf_counter()
     
     # Determine title color based on month position
     if month_position is not None:
@@ -474,99 +1391,94 @@ def gantt_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path, month
     else:
         title_color = '#0f172a'  # Default dark color
     
-    # Modern title with enhanced styling and color coding
-    title_text = ax.set_title(f"Events — {mname} {year}", 
-                             fontsize=28, fontweight='700', color=title_color, 
-                             pad=30, fontfamily='sans-serif')
-    title_text.set_bbox(dict(boxstyle="round,pad=0.5", facecolor='#f1f5f9', 
-                            alpha=0.8, edgecolor='none'))
-    
-    # Enhanced x-axis formatting - no rotation needed for day numbers
-    plt.xticks(rotation=0, fontsize=11, color='#475569', fontweight='500')
-    
-    # Better y-axis formatting for event names
-    ax.tick_params(axis='y', labelsize=11, colors='#334155', pad=8)
-    ax.tick_params(axis='x', labelsize=11, colors='#475569', pad=5)
-    
-    # Improve the appearance of event names with better typography
-    for label in ax.get_yticklabels():
-        label.set_fontweight('500')
-        label.set_fontfamily('sans-serif')
-    
-    for label in ax.get_xticklabels():
-        label.set_fontweight('500')
-        label.set_fontfamily('sans-serif')
-        
-    # Modern border styling
-    for spine in ax.spines.values():
-        spine.set_edgecolor('#cbd5e1')
-        spine.set_linewidth(1.5)
-    
-    # Remove top and right spines for cleaner look
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    
-    # Create an enhanced legend for the color coding
-    if 'Owner' in sub.columns:
-        unique_owners = sub['Owner'].dropna().unique()
-        legend_elements = []
-        for owner in sorted(unique_owners):
-            if pd.notna(owner) and str(owner).strip():
-                color = get_seller_color(owner)
-                legend_elements.append(plt.Rectangle((0,0),1,1, facecolor=color, 
-                                                   edgecolor='white', linewidth=1.5,
-                                                   label=str(owner).strip(), alpha=0.9))
+    with gantt_style():
+        fig_h = max(4.0, len(sub) * 0.4 + 3.5)  # More space for better readability
+        fig, ax = gantt_figure(sub, starts, durations, colors, fig_h, profile,
+                               f"Events — {mname} {year}", title_color)
+        
+        ax.set_xlim(mstart - pd.Timedelta(hours=12), mend + pd.Timedelta(hours=36))
+        
+        # Use daily ticks to show day numbers
+        ax.xaxis.set_major_locator(mdates.DayLocator(interval=1))
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%d"))  # Just day numbers
+        
+        # Add week indicators with Monday markers (more prominent)
+        ax.xaxis.set_minor_locator(mdates.WeekdayLocator(byweekday=mdates.MO))
+        
+        # Modern grid styling with enhanced week indicators
+        ax.grid(axis="x", linestyle="-", linewidth=0.8, alpha=0.15, color='#94a3b8')  # Daily grid lines
+        ax.grid(axis="x", which='minor', linestyle="-", linewidth=2.0, alpha=0.4, color='#475569')  # Week boundaries
+        
+        # Add subtle week boundary indicators and alternating backgrounds
+        week_dates = pd.date_range(mstart, mend, freq='W-MON')
+        for i, date in enumerate(week_dates):
+            if mstart <= date <= mend:
+                # Week boundary line
+                ax.axvline(x=date, color='#334155', linewidth=2.5, alpha=0.6, zorder=1)
+                
+                # Alternating week background (every other week gets subtle shading)
+                if i % 2 == 1:
+                    week_end = min(date + pd.Timedelta(days=6, hours=23, minutes=59), mend)
+                    ax.axvspan(date, week_end, color='#f1f5f9', alpha=0.3, zorder=0)
         
-        if legend_elements:
-            legend = ax.legend(handles=legend_elements, loc='upper right', 
-                             frameon=True, fancybox=True, shadow=True, 
-                             framealpha=0.95, facecolor='#f8fafc',
-                             edgecolor='#e2e8f0',
-                             title='Sales Team', fontsize=11,
-                             title_fontsize=13)
-            legend.get_title().set_fontweight('600')
-            legend.get_title().set_color('#1e293b')
+        # Add current date indicator (vertical red line)
+        current_date = pd.Timestamp(datetime.now().date())
+        if mstart <= current_date <= mend:
+            # Draw a prominent red vertical line for today
+            ax.axvline(x=current_date, color='#ef4444', linewidth=3.0, alpha=0.8, zorder=10, 
+                       linestyle='-', label='Today')
             
-            # Style legend text
-            for text in legend.get_texts():
-                text.set_fontweight('500')
-                text.set_color('#374151')
-
-    outfile = outdir / f"gantt_{year}_{month:02d}.png"
-    fig.savefig(outfile, dpi=300, bbox_inches='tight', facecolor='#f8fafc', 
-                edgecolor='none', pad_inches=0.3, 
-                metadata={'Title': f'Events - {mname} {year}', 'Software': 'Encore Dashboard'})
-    plt.close(fig)
+            # Add a subtle red glow/shadow effect
+            ax.axvline(x=current_date, color='#ef4444', linewidth=6.0, alpha=0.2, zorder=9)
+            
+            # Optional: Add "Today" text at the top of the line
+            ax.text(current_date, ax.get_ylim()[1], 'Today', 
+                    horizontalalignment='center', verticalalignment='bottom',
+                    fontsize=10, color='#ef4444', fontweight='bold',
+                    bbox=dict(boxstyle="round,pad=0.3", facecolor='white', 
+                             edgecolor='#ef4444', alpha=0.9))
+        
+        build_done = time.perf_counter()
+        save_chart(fig, outfile, profile, pad_inches=0.3,
+                   metadata={'Title': f'Events - {mname} {year}', 'Software': 'Encore Dashboard',
+                             FINGERPRINT_KEY: fingerprint},
+                   optimize=optimize, formats=formats)
+        plt.close(fig)
+    record_chart(outfile, len(sub), filter_done - chart_started,
+                 build_done - filter_done, time.perf_counter() - build_done)
     
     # Report filtering results
-    total_events = len(df.loc[(df["Event Start Date"] <= mend) & (df["Event End Date"] >= mstart)])
+    total_events = len(window)
     filtered_events = len(sub)
     
     # Calculate individual filter counts
-    all_month_events = df.loc[(df["Event Start Date"] <= mend) & (df["Event End Date"] >= mstart)].copy()
-    icw_filtered = len(all_month_events[all_month_events["Event Name"].str.contains("ICW", case=False, na=False)])
-    marriott_filtered = len(all_month_events[all_month_events["Event Name"].str.contains("Marriott In-House Events 2025", case=False, na=False)])
+    excluded, _ = filter_report(window, "month")
+    filter_counts = ", ".join(f"{label}: {count}" for label, count in excluded)
     total_filtered = total_events - filtered_events
     
     print(f"Saved {outfile}")
-    print(f"  Events shown: {filtered_events}, Filtered: {total_filtered} (ICW: {icw_filtered}, Marriott In-House: {marriott_filtered})")
+    print(f"  Events shown: {filtered_events}, Filtered: {total_filtered} ({filter_counts})")
+    return outfile
 
 
-def gantt_for_week(df: pd.DataFrame, outdir: Path) -> None:
-    """Draw + save a 'Happening This Week' chart for the current week (Monday to Sunday)."""
+def gantt_for_week(df: pd.DataFrame, outdir: Path, force: bool = False, profile: str = DEFAULT_PROFILE,
+                   optimize: bool = False, formats=()) -> Path:
+    """Draw + save a 'Happening This Week' chart for the current week (Monday to Sunday).
+    
+    Returns the chart path (None when there are no events this week).
+    """
+    chart_started = time.perf_counter()
     week_start, week_end = get_current_week()
     
     # Format week for display
     week_display = f"{week_start.strftime('%b %d')} - {week_end.strftime('%b %d, %Y')}"
     
     # Filter events for this week
-    mask = (df["Event Start Date"] <= week_end) & (df["Event End Date"] >= week_start)
-    sub = df.loc[mask].copy()
+    window = events_in_window(df, week_start, week_end)
     
-    # Filter out Marriott In-House Events 2025 (but keep ICW events for complete visibility)
-    # Monthly charts exclude both ICW and Marriott In-House events
-    marriott_mask = ~sub["Event Name"].str.contains("Marriott In-House Events 2025", case=False, na=False)
-    sub = sub.loc[marriott_mask]
+    # Apply the weekly filter rules (by default only Marriott In-House events are
+    # excluded; ICW events stay for complete visibility, unlike the monthly charts)
+    sub = visible_events(window, "week")
     
     if sub.empty:
         print(f"[This Week]  No events happening this week.")
@@ -576,315 +1488,245 @@ def gantt_for_week(df: pd.DataFrame, outdir: Path) -> None:
     # This will display most recent events at the top of the chart
     sub = sub.sort_values("Event Start Date", ascending=False)
 
+    # Skip the render when the chart on disk was drawn from identical inputs
+    # Use Monday's date for filename consistency
+    outfile = outdir / f"gantt_weekly_{week_start.strftime('%Y_%m_%d')}.png"
+    fingerprint = render_fingerprint(sub, profile, "week", week_start, week_end)
+    if skip_if_current(outfile, fingerprint, force):
+        return outfile
+
     # Clip to the week window and prepare data
-    starts, durations, colors = [], [], []
-    for _, row in sub.iterrows():
-        s = max(row["Event Start Date"], week_start)
-        e = min(row["Event End Date"], week_end)
-        starts.append(s)
-        durations.append((e - s).total_seconds() / 86400 + 1)  # Convert to days
-        colors.append(get_seller_color(row.get("Owner", "")))
-
-    # Enhanced plotting with modern styling for weekly view
-    fig_h = max(4.5, len(sub) * 0.45 + 3.5)  # More space for weekly view
-    fig_w = 20.0
-    
-    # Create figure with modern styling
-    plt.style.use('default')
-    fig, ax = plt.subplots(figsize=(fig_w, fig_h), constrained_layout=True)
-    
-    # Modern gradient background
-    fig.patch.set_facecolor('#f8fafc')
-    ax.set_facecolor('#ffffff')
+    starts, durations, colors = bar_geometry(sub, week_start, week_end)
+
+    filter_done = time.perf_counter()
     
-    # Create the horizontal bar chart with enhanced styling
-    bars = ax.barh(sub["Event Name"], durations, left=starts, color=colors, 
-                   alpha=0.9, edgecolor='white', linewidth=1.5, height=0.7)
-    
-    # Enhanced bar styling with transparency
-    for bar, color in zip(bars, colors):
-        bar.set_alpha(0.85)
-        bar.set_linewidth(1.5)
-        bar.set_edgecolor('white')
-    
-    # Enhanced styling for weekly view
-    ax.set_xlim(week_start - pd.Timedelta(hours=6), week_end + pd.Timedelta(hours=18))
-    
-    # Use daily locator for better weekly granularity
-    ax.xaxis.set_major_locator(mdates.DayLocator(interval=1))
-    ax.xaxis.set_major_formatter(mdates.DateFormatter("%a\n%b %d"))
-    
-    # Modern grid styling
-    ax.grid(axis="x", linestyle="-", linewidth=1.2, alpha=0.2, color='#64748b')
-    ax.grid(axis="x", which='minor', linestyle=":", linewidth=0.8, alpha=0.15, color='#94a3b8')
-    ax.set_axisbelow(True)
-    
-    # Enhanced labels and title with modern typography
-    ax.set_xlabel("Date", fontsize=16, fontweight='600', color='#1e293b', 
-                  labelpad=15, fontfamily='sans-serif')
-    ax.set_ylabel("Events", fontsize=16, fontweight='600', color='#1e293b', 
-                  labelpad=15, fontfamily='sans-serif')
-    
-    # Modern title with enhanced styling - Orange for weekly
-    title_text = ax.set_title(f"Happening This Week — {week_display}", 
-                             fontsize=28, fontweight='700', color='#f97316',  # Orange for weekly
-                             pad=30, fontfamily='sans-serif')
-    title_text.set_bbox(dict(boxstyle="round,pad=0.5", facecolor='#f1f5f9', 
-                            alpha=0.8, edgecolor='none'))
-    
-    # Enhanced x-axis formatting
-    plt.xticks(rotation=0, fontsize=12, color='#475569', fontweight='500')  # No rotation for weekly view
-    
-    # Better y-axis formatting for event names
-    ax.tick_params(axis='y', labelsize=11, colors='#334155', pad=8)
-    ax.tick_params(axis='x', labelsize=11, colors='#475569', pad=5)
-    
-    # Improve the appearance of event names with better typography
-    for label in ax.get_yticklabels():
-        label.set_fontweight('500')
-        label.set_fontfamily('sans-serif')
-    
-    for label in ax.get_xticklabels():
-        label.set_fontweight('500')
-        label.set_fontfamily('sans-serif')
+    with gantt_style():
+        # Orange title for the weekly chart
+        fig_h = max(4.5, len(sub) * 0.45 + 3.5)  # More space for weekly view
+        fig, ax = gantt_figure(sub, starts, durations, colors, fig_h, profile,
+                               f"Happening This Week — {week_display}", '#f97316')
         
-    # Modern border styling
-    for spine in ax.spines.values():
-        spine.set_edgecolor('#cbd5e1')
-        spine.set_linewidth(1.5)
-    
-    # Remove top and right spines for cleaner look
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    
-    # Create an enhanced legend for the color coding
-    if 'Owner' in sub.columns:
-        unique_owners = sub['Owner'].dropna().unique()
-        legend_elements = []
-        for owner in sorted(unique_owners):
-            if pd.notna(owner) and str(owner).strip():
-                color = get_seller_color(owner)
-                legend_elements.append(plt.Rectangle((0,0),1,1, facecolor=color, 
-                                                   edgecolor='white', linewidth=1.5,
-                                                   label=str(owner).strip(), alpha=0.9))
+        ax.set_xlim(week_start - pd.Timedelta(hours=6), week_end + pd.Timedelta(hours=18))
         
-        if legend_elements:
-            legend = ax.legend(handles=legend_elements, loc='upper right', 
-                             frameon=True, fancybox=True, shadow=True, 
-                             framealpha=0.95, facecolor='#f8fafc',
-                             edgecolor='#e2e8f0',
-                             title='Sales Team', fontsize=11,
-                             title_fontsize=13)
-            legend.get_title().set_fontweight('600')
-            legend.get_title().set_color('#1e293b')
-            
-            # Style legend text
-            for text in legend.get_texts():
-                text.set_fontweight('500')
-                text.set_color('#374151')
-
-    # Use Monday's date for filename consistency
-    outfile = outdir / f"gantt_weekly_{week_start.strftime('%Y_%m_%d')}.png"
-    fig.savefig(outfile, dpi=300, bbox_inches='tight', facecolor='#f8fafc', 
-                edgecolor='none', pad_inches=0.3,
-                metadata={'Title': f'Happening This Week - {week_display}', 'Software': 'Encore Dashboard'})
-    plt.close(fig)
+        # Use daily locator for better weekly granularity
+        ax.xaxis.set_major_locator(mdates.DayLocator(interval=1))
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%a\n%b %d"))
+        
+        # Modern grid styling
+        ax.grid(axis="x", linestyle="-", linewidth=1.2, alpha=0.2, color='#64748b')
+        ax.grid(axis="x", which='minor', linestyle=":", linewidth=0.8, alpha=0.15, color='#94a3b8')
+        
+        build_done = time.perf_counter()
+        save_chart(fig, outfile, profile, pad_inches=0.3,
+                   metadata={'Title': f'Happening This Week - {week_display}', 'Software': 'Encore Dashboard',
+                             FINGERPRINT_KEY: fingerprint},
+                   optimize=optimize, formats=formats)
+        plt.close(fig)
+    record_chart(outfile, len(sub), filter_done - chart_started,
+                 build_done - filter_done, time.perf_counter() - build_done)
     
     # Report results
-    total_events = len(df.loc[(df["Event Start Date"] <= week_end) & (df["Event End Date"] >= week_start)])
+    total_events = len(window)
     filtered_events = len(sub)
     
-    # Calculate Marriott In-House events filtered
-    all_week_events = df.loc[(df["Event Start Date"] <= week_end) & (df["Event End Date"] >= week_start)].copy()
-    marriott_filtered = len(all_week_events[all_week_events["Event Name"].str.contains("Marriott In-House Events 2025", case=False, na=False)])
+    # Describe which rules applied to this view
+    excluded, ignored = filter_report(window, "week")
+    filter_notes = [f"includes {label} events" for label in ignored]
+    filter_notes += [f"excludes {count} {label} events" for label, count in excluded]
     
     print(f"Saved {outfile}")
-    print(f"  Weekly events shown: {filtered_events} (includes ICW events, excludes {marriott_filtered} Marriott In-House events)")
+    print(f"  Weekly events shown: {filtered_events} ({', '.join(filter_notes)})")
     print(f"  Week period: {week_display}")
+    return outfile
 
 
-def gantt_for_day(df: pd.DataFrame, outdir: Path) -> None:
-    """Draw + save a 'Happening Today' chart for the current day (midnight to 11:59 PM)."""
+def gantt_for_day(df: pd.DataFrame, outdir: Path, force: bool = False, profile: str = DEFAULT_PROFILE,
+                  optimize: bool = False, formats=()) -> Path:
+    """Draw + save a 'Happening Today' chart for the current day (midnight to 11:59 PM).
+    
+    Returns the chart path.
+    """
+    chart_started = time.perf_counter()
     day_start, day_end = get_current_day()
     
     # Format day for display
     day_display = day_start.strftime('%A, %B %d, %Y')
     
     # Filter events for today
-    mask = (df["Event Start Date"] <= day_end) & (df["Event End Date"] >= day_start)
-    sub = df.loc[mask].copy()
+    window = events_in_window(df, day_start, day_end)
     
-    # Filter out Marriott In-House Events 2025 (but keep ICW events for complete visibility)
-    # Monthly charts exclude both ICW and Marriott In-House events
-    marriott_mask = ~sub["Event Name"].str.contains("Marriott In-House Events 2025", case=False, na=False)
-    sub = sub.loc[marriott_mask]
+    # Apply the daily filter rules (by default only Marriott In-House events are
+    # excluded; ICW events stay for complete visibility, unlike the monthly charts)
+    sub = visible_events(window, "day")
     
     if sub.empty:
         print(f"[Today]  No events happening today, but generating chart anyway.")
         # Create a placeholder chart even with no events
     
+    # Sort by start date in descending order (most recent first)
+    # This will display most recent events at the top of the chart
+    sub = sub.sort_values("Event Start Date", ascending=False)
+    
+    # Skip the render when the chart on disk was drawn from identical inputs
+    # Use today's date for filename consistency
+    outfile = outdir / f"gantt_daily_{day_start.strftime('%Y_%m_%d')}.png"
+    fingerprint = render_fingerprint(sub, profile, "day", day_start, day_end)
+    if skip_if_current(outfile, fingerprint, force):
+        return outfile
+    
     # Handle empty events case
     if not sub.empty:
-        # Sort by start date in descending order (most recent first)
-        # This will display most recent events at the top of the chart
-        sub = sub.sort_values("Event Start Date", ascending=False)
-
         # Clip to the day window and prepare data
-        starts, durations, colors = [], [], []
-        for _, row in sub.iterrows():
-            s = max(row["Event Start Date"], day_start)
-            e = min(row["Event End Date"], day_end)
-            starts.append(s)
-            durations.append((e - s).total_seconds() / 86400 + 1)  # Convert to days
-            colors.append(get_seller_color(row.get("Owner", "")))
+        starts, durations, colors = bar_geometry(sub, day_start, day_end)
     else:
         # No events - create empty chart with placeholder
         starts, durations, colors = [], [], []
 
-    # Enhanced plotting with modern styling for daily view
-    fig_h = max(5.0, max(len(sub) * 0.5, 2.0) + 4.0)  # Minimum height even with no events
-    fig_w = 20.0
-    
-    # Create figure with modern styling
-    plt.style.use('default')
-    fig, ax = plt.subplots(figsize=(fig_w, fig_h), constrained_layout=True)
-    
-    # Modern gradient background
-    fig.patch.set_facecolor('#f8fafc')
-    ax.set_facecolor('#ffffff')
+    filter_done = time.perf_counter()
     
-    # Create the horizontal bar chart with enhanced styling
-    if not sub.empty:
-        bars = ax.barh(sub["Event Name"], durations, left=starts, color=colors, 
-                       alpha=0.9, edgecolor='white', linewidth=1.5, height=0.7)
+    with gantt_style():
+        # Red title for the daily chart
+        fig_h = max(5.0, max(len(sub) * 0.5, 2.0) + 4.0)  # Minimum height even with no events
+        fig, ax = gantt_figure(sub, starts, durations, colors, fig_h, profile,
+                               f"Happening Today — {day_display}", '#ef4444', xlabel="Time")
         
-        # Enhanced bar styling with transparency
-        for bar, color in zip(bars, colors):
-            bar.set_alpha(0.85)
-            bar.set_linewidth(1.5)
-            bar.set_edgecolor('white')
-    else:
-        # No events - show a message
-        ax.text(0.5, 0.5, 'No Events Scheduled Today', 
-                transform=ax.transAxes, ha='center', va='center',
-                fontsize=24, fontweight='600', color='#64748b',
-                fontfamily='sans-serif')
-    
-    # Enhanced styling for daily view
-    ax.set_xlim(day_start - pd.Timedelta(minutes=30), day_end + pd.Timedelta(hours=1))
-    
-    # Use hourly locator for better daily granularity
-    ax.xaxis.set_major_locator(mdates.HourLocator(interval=4))  # Every 4 hours
-    ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
-    ax.xaxis.set_minor_locator(mdates.HourLocator(interval=1))  # Every hour as minor ticks
-    
-    # Modern grid styling
-    ax.grid(axis="x", linestyle="-", linewidth=1.2, alpha=0.2, color='#64748b')
-    ax.grid(axis="x", which='minor', linestyle=":", linewidth=0.8, alpha=0.15, color='#94a3b8')
-    ax.set_axisbelow(True)
-    
-    # Enhanced labels and title with modern typography
-    ax.set_xlabel("Time", fontsize=16, fontweight='600', color='#1e293b', 
-                  labelpad=15, fontfamily='sans-serif')
-    ax.set_ylabel("Events", fontsize=16, fontweight='600', color='#1e293b', 
-                  labelpad=15, fontfamily='sans-serif')
-    
-    # Modern title with enhanced styling - Red for daily
-    title_text = ax.set_title(f"Happening Today — {day_display}", 
-                             fontsize=28, fontweight='700', color='#ef4444',  # Red for daily
-                             pad=30, fontfamily='sans-serif')
-    title_text.set_bbox(dict(boxstyle="round,pad=0.5", facecolor='#f1f5f9', 
-                            alpha=0.8, edgecolor='none'))
-    
-    # Enhanced axis formatting
-    plt.xticks(rotation=0, fontsize=12, color='#475569', fontweight='500')
-    
-    # Better y-axis formatting for event names
-    ax.tick_params(axis='y', labelsize=11, colors='#334155', pad=8)
-    ax.tick_params(axis='x', labelsize=11, colors='#475569', pad=5)
-    
-    # Improve the appearance of event names with better typography
-    for label in ax.get_yticklabels():
-        label.set_fontweight('500')
-        label.set_fontfamily('sans-serif')
-    
-    for label in ax.get_xticklabels():
-        label.set_fontweight('500')
-        label.set_fontfamily('sans-serif')
+        if sub.empty:
+            # No events - show a message
+            ax.text(0.5, 0.5, 'No Events Scheduled Today', 
+                    transform=ax.transAxes, ha='center', va='center',
+                    fontsize=24, fontweight='600', color='#64748b',
+                    fontfamily='sans-serif')
         
-    # Modern border styling
-    for spine in ax.spines.values():
-        spine.set_edgecolor('#cbd5e1')
-        spine.set_linewidth(1.5)
-    
-    # Remove top and right spines for cleaner look
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    
-    # Create an enhanced legend for the color coding
-    if not sub.empty and 'Owner' in sub.columns:
-        unique_owners = sub['Owner'].dropna().unique()
-        legend_elements = []
-        for owner in sorted(unique_owners):
-            if pd.notna(owner) and str(owner).strip():
-                color = get_seller_color(owner)
-                legend_elements.append(plt.Rectangle((0,0),1,1, facecolor=color, 
-                                                   edgecolor='white', linewidth=1.5,
-                                                   label=str(owner).strip(), alpha=0.9))
+        ax.set_xlim(day_start - pd.Timedelta(minutes=30), day_end + pd.Timedelta(hours=1))
         
-        if legend_elements:
-            legend = ax.legend(handles=legend_elements, loc='upper right', 
-                             frameon=True, fancybox=True, shadow=True, 
-                             framealpha=0.95, facecolor='#f8fafc',
-                             edgecolor='#e2e8f0',
-                             title='Sales Team', fontsize=11,
-                             title_fontsize=13)
-            legend.get_title().set_fontweight('600')
-            legend.get_title().set_color('#1e293b')
-            
-            # Style legend text
-            for text in legend.get_texts():
-                text.set_fontweight('500')
-                text.set_color('#374151')
-
-    # Use today's date for filename consistency
-    outfile = outdir / f"gantt_daily_{day_start.strftime('%Y_%m_%d')}.png"
-    fig.savefig(outfile, dpi=300, bbox_inches='tight', facecolor='#f8fafc', 
-                edgecolor='none', pad_inches=0.3,
-                metadata={'Title': f'Happening Today - {day_display}', 'Software': 'Encore Dashboard'})
-    plt.close(fig)
+        # Use hourly locator for better daily granularity
+        ax.xaxis.set_major_locator(mdates.HourLocator(interval=4))  # Every 4 hours
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M"))
+        ax.xaxis.set_minor_locator(mdates.HourLocator(interval=1))  # Every hour as minor ticks
+        
+        # Modern grid styling
+        ax.grid(axis="x", linestyle="-", linewidth=1.2, alpha=0.2, color='#64748b')
+        ax.grid(axis="x", which='minor', linestyle=":", linewidth=0.8, alpha=0.15, color='#94a3b8')
+        
+        build_done = time.perf_counter()
+        save_chart(fig, outfile, profile, pad_inches=0.3,
+                   metadata={'Title': f'Happening Today - {day_display}', 'Software': 'Encore Dashboard',
+                             FINGERPRINT_KEY: fingerprint},
+                   optimize=optimize, formats=formats)
+        plt.close(fig)
+    record_chart(outfile, len(sub), filter_done - chart_started,
+                 build_done - filter_done, time.perf_counter() - build_done)
     
     # Report results
-    total_events = len(df.loc[(df["Event Start Date"] <= day_end) & (df["Event End Date"] >= day_start)])
+    total_events = len(window)
     filtered_events = len(sub)
     
-    # Calculate Marriott In-House events filtered
-    all_day_events = df.loc[(df["Event Start Date"] <= day_end) & (df["Event End Date"] >= day_start)].copy()
-    marriott_filtered = len(all_day_events[all_day_events["Event Name"].str.contains("Marriott In-House Events 2025", case=False, na=False)])
+    # Describe which rules applied to this view
+    excluded, ignored = filter_report(window, "day")
+    filter_notes = [f"includes {label} events" for label in ignored]
+    filter_notes += [f"excludes {count} {label} events" for label, count in excluded]
     
     print(f"Saved {outfile}")
-    print(f"  Daily events shown: {filtered_events} (includes ICW events, excludes {marriott_filtered} Marriott In-House events)")
+    print(f"  Daily events shown: {filtered_events} ({', '.join(filter_notes)})")
     print(f"  Day: {day_display}")
+    return outfile
+
 
+def calendar_cells(cal: list[list[int]]) -> list[tuple[int, int]]:
+    """Grid cell (x, y) of every day in a calendar.monthcalendar() grid, indexed by day number.
 
-def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path) -> None:
-    """Draw + save a professional calendar view for the specified month."""
+    y counts up from the bottom week row, matching the calendar axes; index 0 is unused.
+    """
+    num_weeks = len(cal)
+    cells = [None] * 32
+    for week_idx, week in enumerate(cal):
+        for day_idx, day in enumerate(week):
+            if day:
+                cells[day] = (day_idx, num_weeks - week_idx - 1)
+    return cells
+
+
+CALENDAR_MAX_SLOTS = 5  # Event rows per calendar cell; further events are counted in a "+N more" badge
+
+
+def allocate_calendar_slots(first_days, last_days, max_slots: int) -> tuple[list[int], list[int]]:
+    """
+    Give each event the lowest vertical slot that is free on every day it covers.
+    
+    first_days/last_days are the day-of-month numbers each event covers
+    (already clipped to the month), in drawing order. Every day keeps a
+    bitmask of taken slots: an event's free slots are the complement of the OR
+    of its days' masks and it takes the lowest one, so the whole month is laid
+    out in one pass over the event-days.
+    
+    Returns (slots, overflow): each event's slot, or -1 when all max_slots are
+    taken on one of its days (or it covers no days), and per day number the
+    count of events left out that way.
+    """
+    day_masks = [0] * 32
+    overflow = [0] * 32
+    all_slots = (1 << max_slots) - 1
+    slots = []
+    for first, last in zip(first_days, last_days):
+        days = range(first, last + 1)
+        taken = 0
+        for day in days:
+            taken |= day_masks[day]
+        free = all_slots & ~taken
+        if not free:
+            for day in days:
+                overflow[day] += 1
+        if not days or not free:
+            slots.append(-1)
+            continue
+        slot_bit = free & -free  # Lowest free slot
+        for day in days:
+            day_masks[day] |= slot_bit
+        slots.append(slot_bit.bit_length() - 1)
+    return slots, overflow
+
+
+def calendar_spans(first_day: int, last_day: int, cells: list[tuple[int, int]]) -> list[tuple[int, int, int]]:
+    """Split the days first_day..last_day into one (start_x, end_x, y) run per calendar week row."""
+    spans = []
+    day = first_day
+    while day <= last_day:
+        x, y = cells[day]
+        end_x = min(6, x + last_day - day)
+        spans.append((x, end_x, y))
+        day += end_x - x + 1
+    return spans
+
+
+def add_patch_batch(ax, shapes: list) -> None:
+    """Draw patches as one PatchCollection, keeping each patch's colors, alpha and line width.
+
+    The shapes are painted in list order, exactly as if each had been added with
+    ax.add_patch(), but the axes issues a single draw call for the whole batch.
+    """
+    if shapes:
+        ax.add_collection(PatchCollection(shapes, match_original=True, joinstyle='miter'), autolim=False)
+
+
+def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path, force: bool = False,
+                       profile: str = DEFAULT_PROFILE, optimize: bool = False, formats=()) -> Path:
+    """Draw + save a professional calendar view for the specified month.
+    
+    Returns the chart path.
+    """
     import textwrap
     from matplotlib.patches import FancyBboxPatch
     
+    chart_started = time.perf_counter()
     mname = calendar.month_name[month]
     mstart = pd.Timestamp(year, month, 1)
     mend = pd.Timestamp(year, month, calendar.monthrange(year, month)[1])
 
     # Filter events for this month
-    mask = (df["Event Start Date"] <= mend) & (df["Event End Date"] >= mstart)
-    sub = df.loc[mask].copy()
+    window = events_in_window(df, mstart, mend)
     
-    # Filter out events containing "ICW" or "Marriott In-House Events 2025" in the name
-    icw_mask = ~sub["Event Name"].str.contains("ICW", case=False, na=False)
-    marriott_mask = ~sub["Event Name"].str.contains("Marriott In-House Events 2025", case=False, na=False)
-    combined_mask = icw_mask & marriott_mask
-    sub = sub.loc[combined_mask]
+    # Apply the calendar filter rules (by default: no ICW or Marriott In-House events)
+    sub = visible_events(window, "calendar")
     
     # Remove duplicate events by name (keep only the first occurrence of each event title)
     events_before_dedup = len(sub)
@@ -895,8 +1737,18 @@ def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path) ->
     if duplicates_removed > 0:
         print(f"  Removed {duplicates_removed} duplicate events (keeping first occurrence of each title)")
     
+    # Skip the render when the calendar on disk was drawn from identical inputs
+    outfile = outdir / f"calendar_{year}_{month:02d}.png"
+    today = pd.Timestamp(datetime.now().date())
+    fingerprint = render_fingerprint(sub, profile, "calendar", mstart, mend, today if mstart <= today <= mend else None)
+    if skip_if_current(outfile, fingerprint, force):
+        return outfile
+    
+    filter_done = time.perf_counter()
+    
     # Create figure with optimal sizing for calendar
     fig_w, fig_h = 22.0, 18.0  # Larger size for better readability
+    fig_w, fig_h = chart_figsize(fig_w, fig_h, profile)
     fig, ax = plt.subplots(figsize=(fig_w, fig_h), constrained_layout=True)
     
     # Elegant gradient background
@@ -931,12 +1783,15 @@ def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path) ->
         # Clean day names header with uniform styling
     day_names = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
     
+    # Header, cell and today-marker patches, drawn as one batch once the grid is laid out
+    grid_patches = []
+    
     # Add subtle background bar for all headers
     header_bg = FancyBboxPatch((0, num_weeks + 0.1), 7, 0.8,
                               boxstyle="round,pad=0.02",
                               facecolor='#f8fafc', alpha=0.8,
                               edgecolor='#e5e7eb', linewidth=1)
-    ax.add_patch(header_bg)
+    grid_patches.append(header_bg)
     
     for i, day_name in enumerate(day_names):
         # Uniform styling for all days
@@ -953,7 +1808,7 @@ def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path) ->
                                    boxstyle="round,pad=0.02",
                                    facecolor=header_color, alpha=0.8,
                                    edgecolor=border_color, linewidth=2)
-        ax.add_patch(header_rect)
+        grid_patches.append(header_rect)
     
     # Draw clean calendar grid with uniform design
     for week_idx, week in enumerate(cal):
@@ -981,21 +1836,21 @@ def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path) ->
                                            boxstyle="round,pad=0.02",
                                            facecolor=shadow_color, alpha=0.08,
                                            edgecolor='none')
-                ax.add_patch(shadow_rect)
+                grid_patches.append(shadow_rect)
                 
                 # Main cell with elegant borders
                 cell_rect = FancyBboxPatch((x_pos + 0.04, y_pos + 0.04), 0.92, 0.92,
                                          boxstyle="round,pad=0.02",
                                          facecolor=cell_color, alpha=0.98,
                                          edgecolor=border_color, linewidth=1.5)
-                ax.add_patch(cell_rect)
+                grid_patches.append(cell_rect)
                 
                 # Inner highlight border for depth
                 inner_rect = FancyBboxPatch((x_pos + 0.06, y_pos + 0.06), 0.88, 0.88,
                                           boxstyle="round,pad=0.01",
                                           facecolor='none',
                                           edgecolor=inner_border, linewidth=1, alpha=0.6)
-                ax.add_patch(inner_rect)
+                grid_patches.append(inner_rect)
             
             # Enhanced day number styling
             if day != 0:
@@ -1008,17 +1863,17 @@ def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path) ->
                     # Outer glow
                     glow_circle = plt.Circle((x_pos + 0.2, y_pos + 0.8), 0.18,
                                            color='#3b82f6', alpha=0.2)
-                    ax.add_patch(glow_circle)
+                    grid_patches.append(glow_circle)
                     
                     # Main today indicator
                     today_circle = plt.Circle((x_pos + 0.2, y_pos + 0.8), 0.14,
                                             color='#3b82f6', alpha=0.95)
-                    ax.add_patch(today_circle)
+                    grid_patches.append(today_circle)
                     
                     # Inner highlight
                     highlight_circle = plt.Circle((x_pos + 0.2, y_pos + 0.8), 0.12,
                                                 color='#60a5fa', alpha=0.3)
-                    ax.add_patch(highlight_circle)
+                    grid_patches.append(highlight_circle)
                     
                     day_color = '#ffffff'
                     day_weight = '800'
@@ -1033,35 +1888,16 @@ def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path) ->
                        fontweight=day_weight, color=day_color,
                        fontfamily='sans-serif')
     
+    add_patch_batch(ax, grid_patches)
+    
     # Add events to calendar with continuous multi-day spans
+    hidden_events = 0
     if not sub.empty:
-        # Create a comprehensive tracking system for event placement
-        # Track which vertical slots are occupied on each day
-        day_slots = {}  # day -> list of occupied slot indices
-        event_placements = []  # Store (event, slot_index, spans) for drawing
-        
         # First pass: count events per day to determine maximum events on any day
-        max_events_per_day = 0
-        events_per_day = {}
-        
-        for _, event in sub.iterrows():
-            event_start = max(event["Event Start Date"], mstart)
-            event_end = min(event["Event End Date"], mend)
-            
-            current_date = event_start.date()
-            end_date = event_end.date()
-            
-            while current_date <= end_date:
-                if current_date.month == month:
-                    day_key = current_date.day
-                    if day_key not in events_per_day:
-                        events_per_day[day_key] = 0
-                    events_per_day[day_key] += 1
-                    max_events_per_day = max(max_events_per_day, events_per_day[day_key])
-                current_date += timedelta(days=1)
+        max_events_per_day = int(event_occupancy(sub, mstart, mend).max())
         
         # Calculate optimal event height for better readability
-        max_events_to_fit = min(max_events_per_day, 5)  # Allow up to 5 events per day for better spacing
+        max_events_to_fit = min(max_events_per_day, CALENDAR_MAX_SLOTS)  # Up to 5 events per day for better spacing
         available_height = 0.65  # Available space in each cell for events (reduced due to increased base_offset)
         event_height = available_height / max_events_to_fit * 0.85  # Use 85% to ensure spacing
         event_spacing = available_height / max_events_to_fit * 0.15  # Use 15% for spacing
@@ -1070,92 +1906,21 @@ def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path) ->
         event_height = max(event_height, 0.08)
         event_spacing = max(event_spacing, 0.02)
         
-        # Second pass: assign vertical slots to events
-        for _, event in sub.iterrows():
-            event_start = max(event["Event Start Date"], mstart)
-            event_end = min(event["Event End Date"], mend)
-            
-            # Calculate all days this event spans within the month
-            span_start = event_start.date()
-            span_end = event_end.date()
-            
-            # Get all days this event spans
-            event_days = []
-            current_date = span_start
-            while current_date <= span_end:
-                if current_date.month == month:
-                    day = current_date.day
-                    # Find position in calendar
-                    for week_idx, week in enumerate(cal):
-                        if day in week:
-                            day_idx = week.index(day)
-                            y_pos = num_weeks - week_idx - 1
-                            x_pos = day_idx
-                            event_days.append((day, x_pos, y_pos))
-                            break
-                current_date += timedelta(days=1)
-            
-            if not event_days:
-                continue
-            
-            # Find the lowest available slot that works for all days in this event
-            slot_index = 0
-            slot_found = False
-            
-            while slot_index < max_events_to_fit and not slot_found:
-                # Check if this slot is available for all days of this event
-                slot_available = True
-                for day, x_pos, y_pos in event_days:
-                    day_key = (day, x_pos, y_pos)
-                    if day_key in day_slots and slot_index in day_slots[day_key]:
-                        slot_available = False
-                        break
-                
-                if slot_available:
-                    # Reserve this slot for all days of this event
-                    for day, x_pos, y_pos in event_days:
-                        day_key = (day, x_pos, y_pos)
-                        if day_key not in day_slots:
-                            day_slots[day_key] = []
-                        day_slots[day_key].append(slot_index)
-                    slot_found = True
-                else:
-                    slot_index += 1
-            
-            if not slot_found:
-                # Skip this event if no slot available (too many events on some day)
-                continue
-            
-            # Group consecutive days by week for continuous spans
-            event_spans = []  # List of (start_x, end_x, week_y) tuples
-            
-            current_span_start = None
-            current_span_y = None
-            
-            for i, (day, x_pos, y_pos) in enumerate(event_days):
-                # Start new span or continue existing
-                if current_span_start is None:
-                    current_span_start = x_pos
-                    current_span_y = y_pos
-                    current_span_end = x_pos
-                elif y_pos == current_span_y and x_pos == current_span_end + 1:
-                    # Continue current span
-                    current_span_end = x_pos
-                else:
-                    # End current span and start new one
-                    event_spans.append((current_span_start, current_span_end, current_span_y))
-                    current_span_start = x_pos
-                    current_span_y = y_pos
-                    current_span_end = x_pos
-            
-            # Add the final span
-            if current_span_start is not None:
-                event_spans.append((current_span_start, current_span_end, current_span_y))
-            
-            # Store event placement info for drawing
-            event_placements.append((event, slot_index, event_spans))
+        # Second pass: assign vertical slots to events and split them into week-row spans
+        first_days = sub["Event Start Date"].clip(lower=mstart).dt.day.tolist()
+        last_days = sub["Event End Date"].clip(upper=mend).dt.day.tolist()
+        slots, overflow = allocate_calendar_slots(first_days, last_days, max_events_to_fit)
+        cells = calendar_cells(cal)
+        
+        # Events without a free slot (too many events on some day) go into the "+N more" badges
+        event_placements = [
+            (event, slot_index, calendar_spans(first_day, last_day, cells))
+            for (_, event), first_day, last_day, slot_index in zip(sub.iterrows(), first_days, last_days, slots)
+            if slot_index >= 0
+        ]
         
-        # Third pass: draw all events using their assigned slots
+        # Third pass: draw all events using their assigned slots (boxes batched, labels as text)
+        event_patches = []
         for event, slot_index, event_spans in event_placements:
             # Get event details
             owner_color = get_seller_color(event.get("Owner", ""))
@@ -1182,14 +1947,14 @@ def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path) ->
                                            boxstyle="round,pad=0.02",
                                            facecolor='#000000', alpha=0.1,
                                            edgecolor='none')
-                ax.add_patch(shadow_rect)
+                event_patches.append(shadow_rect)
                 
                 # Create beautiful continuous event box
                 event_rect = FancyBboxPatch((rect_x, rect_y), rect_width, rect_height,
                                           boxstyle="round,pad=0.02",
                                           facecolor=owner_color, alpha=0.9,
                                           edgecolor='white', linewidth=2)
-                ax.add_patch(event_rect)
+                event_patches.append(event_rect)
                 
                 # Add subtle inner highlight for depth
                 highlight_rect = FancyBboxPatch((rect_x + 0.005, rect_y + 0.005), 
@@ -1197,7 +1962,7 @@ def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path) ->
                                               boxstyle="round,pad=0.005",
                                               facecolor='white', alpha=0.2,
                                               edgecolor='none')
-                ax.add_patch(highlight_rect)
+                event_patches.append(highlight_rect)
                 
                 # Add event text with smart sizing based on total span width
                 # Scale font size based on available height
@@ -1234,6 +1999,19 @@ def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path) ->
                        ha='center', va='center', fontsize=font_size, 
                        fontweight='600', color='black',
                        fontfamily='sans-serif')
+        
+        add_patch_batch(ax, event_patches)
+        
+        # "+N more" badge in the top-right corner of each cell with events that did not fit
+        for day, hidden in enumerate(overflow):
+            if hidden:
+                x_pos, y_pos = cells[day]
+                ax.text(x_pos + 0.94, y_pos + 0.87, f"+{hidden} more",
+                        ha='right', va='center', fontsize=11, fontweight='700',
+                        color='#4b5563', fontfamily='sans-serif',
+                        bbox=dict(boxstyle="round,pad=0.25", facecolor='#f3f4f6',
+                                  edgecolor='#d1d5db', linewidth=1))
+        hidden_events = sum(slot < 0 and first <= last for slot, first, last in zip(slots, first_days, last_days))
     
     # Create an elegant legend positioned to avoid Monday coverage
     if 'Owner' in sub.columns and not sub.empty:
@@ -1272,31 +2050,570 @@ def calendar_for_month(df: pd.DataFrame, year: int, month: int, outdir: Path) ->
     
 
     
-    outfile = outdir / f"calendar_{year}_{month:02d}.png"
-    fig.savefig(outfile, dpi=300, bbox_inches='tight', facecolor='#f8fafc', 
-                edgecolor='none', pad_inches=0.4, 
-                metadata={'Title': f'Calendar - {mname} {year}', 'Software': 'Encore Dashboard'})
+    build_done = time.perf_counter()
+    save_chart(fig, outfile, profile, pad_inches=0.4,
+               metadata={'Title': f'Calendar - {mname} {year}', 'Software': 'Encore Dashboard',
+                         FINGERPRINT_KEY: fingerprint},
+               optimize=optimize, formats=formats)
     plt.close(fig)
+    record_chart(outfile, len(sub), filter_done - chart_started,
+                 build_done - filter_done, time.perf_counter() - build_done)
     
     # Report filtering results
-    total_events = len(df.loc[(df["Event Start Date"] <= mend) & (df["Event End Date"] >= mstart)])
+    total_events = len(window)
     filtered_events = len(sub)
     
     # Calculate individual filter counts
-    all_month_events = df.loc[(df["Event Start Date"] <= mend) & (df["Event End Date"] >= mstart)].copy()
-    icw_filtered = len(all_month_events[all_month_events["Event Name"].str.contains("ICW", case=False, na=False)])
-    marriott_filtered = len(all_month_events[all_month_events["Event Name"].str.contains("Marriott In-House Events 2025", case=False, na=False)])
+    excluded, _ = filter_report(window, "calendar")
+    filter_counts = ", ".join(f"{label}: {count}" for label, count in excluded)
     total_filtered = total_events - filtered_events
     
     print(f"Saved {outfile}")
     if duplicates_removed > 0:
-        print(f"  Calendar events shown: {filtered_events}, Filtered: {total_filtered} (ICW: {icw_filtered}, Marriott In-House: {marriott_filtered}, Duplicates: {duplicates_removed})")
+        print(f"  Calendar events shown: {filtered_events}, Filtered: {total_filtered} ({filter_counts}, Duplicates: {duplicates_removed})")
     else:
-        print(f"  Calendar events shown: {filtered_events}, Filtered: {total_filtered} (ICW: {icw_filtered}, Marriott In-House: {marriott_filtered})")
+        print(f"  Calendar events shown: {filtered_events}, Filtered: {total_filtered} ({filter_counts})")
+    if hidden_events:
+        print(f"  {hidden_events} event(s) summarized in '+N more' badges (over {CALENDAR_MAX_SLOTS} on a day)")
+    return outfile
+
+
+
+YEAR_OVERVIEW_EMPTY = "#e2e8f0"   # Days without events
+YEAR_OVERVIEW_NO_DAY = "#f8fafc"  # Cells past the end of a month (matches the figure background)
+
+
+def year_overview(df: pd.DataFrame, year: int, outdir: Path, force: bool = False,
+                  profile: str = DEFAULT_PROFILE, optimize: bool = False, formats=()) -> Path:
+    """Draw + save a 12-month heat strip of the year: one cell per day, one row per month.
+    
+    Each cell is tinted with the color of the owner with the most events that day,
+    darker the more events run that day. The counts come from one owner_occupancy()
+    pass over the year's events and the whole strip is drawn as a single image.
+    
+    Returns the chart path (None when the year has no events to draw).
+    """
+    chart_started = time.perf_counter()
+    ystart = pd.Timestamp(year, 1, 1)
+    yend = pd.Timestamp(year, 12, 31)
+    
+    # Same filter rules as the month charts the overview summarizes
+    window = events_in_window(df, ystart, yend)
+    sub = visible_events(window, "month")
+    
+    if sub.empty:
+        print(f"[{year}]  No events in sheet for this year (after filtering).")
+        return
+    
+    outfile = outdir / f"year_overview_{year}.png"
+    fingerprint = render_fingerprint(sub, profile, "year", ystart, yend)
+    if skip_if_current(outfile, fingerprint, force):
+        return outfile
+    
+    counts = owner_occupancy(sub, ystart, yend)
+    totals = counts.sum(axis=1)
+    busy = totals > 0
+    dominant = counts[busy].idxmax(axis=1)
+    peak = int(totals.max())
+    
+    # Day-of-year values laid out as a months x 31 grid
+    rows = totals.index.month.to_numpy() - 1
+    cols = totals.index.day.to_numpy() - 1
+    grid = np.zeros((12, 31), dtype=int)
+    grid[rows, cols] = totals.to_numpy()
+    
+    # Blend each busy day's owner color from white by its share of the peak day
+    image = np.tile(np.array(to_rgb(YEAR_OVERVIEW_NO_DAY)), (12, 31, 1))
+    image[rows, cols] = to_rgb(YEAR_OVERVIEW_EMPTY)
+    palette = {owner: np.array(to_rgb(get_seller_color(owner))) for owner in dominant.unique()}
+    owner_rgb = np.array([palette[owner] for owner in dominant]).reshape(-1, 3)
+    shade = (0.35 + 0.65 * totals[busy].to_numpy() / peak)[:, None]
+    image[rows[busy.to_numpy()], cols[busy.to_numpy()]] = 1.0 - shade * (1.0 - owner_rgb)
+    
+    filter_done = time.perf_counter()
+    
+    with gantt_style():
+        fig_w, fig_h = chart_figsize(20.0, 8.0, profile)
+        fig, ax = plt.subplots(figsize=(fig_w, fig_h), constrained_layout=True)
+        ax.imshow(image, aspect='auto', interpolation='nearest', extent=(0.5, 31.5, 12.5, 0.5))
+        
+        ax.set_xticks(range(1, 32))
+        ax.set_yticks(range(1, 13), labels=[calendar.month_abbr[m] for m in range(1, 13)])
+        ax.set_xticks(np.arange(1.5, 31.5), minor=True)
+        ax.set_yticks(np.arange(1.5, 12.5), minor=True)
+        ax.tick_params(which='minor', length=0)
+        ax.tick_params(axis='y', colors='#334155', pad=8)
+        ax.tick_params(axis='x', colors='#475569', pad=5)
+        ax.grid(which='minor', color='white', linewidth=2.0)
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+        
+        # Busiest day of each month at the end of its row
+        for month, month_peak in enumerate(grid.max(axis=1), start=1):
+            if month_peak:
+                ax.text(31.8, month, f"peak {month_peak}", va='center', ha='left',
+                        fontsize=11, color='#475569')
+        
+        ax.set_xlabel("Day of month (color = owner with the most events that day, darker = more events)")
+        title_text = ax.set_title(f"{year} at a Glance — Events per Day", color='#0f172a')
+        title_text.set_bbox(dict(boxstyle="round,pad=0.5", facecolor='#f1f5f9',
+                                 alpha=0.8, edgecolor='none'))
+        add_sales_team_legend(ax, sub, loc='upper left', bbox_to_anchor=(1.06, 1.0))
+        
+        build_done = time.perf_counter()
+        save_chart(fig, outfile, profile, pad_inches=0.3,
+                   metadata={'Title': f'{year} at a Glance', 'Software': 'Encore Dashboard',
+                             FINGERPRINT_KEY: fingerprint},
+                   optimize=optimize, formats=formats)
+        plt.close(fig)
+    record_chart(outfile, len(sub), filter_done - chart_started,
+                 build_done - filter_done, time.perf_counter() - build_done)
+    
+    busiest = totals.idxmax()
+    print(f"Saved {outfile}")
+    print(f"  Year overview: {len(sub)} events on {int(busy.sum())} busy days, "
+          f"peak {peak} on {busiest.strftime('%b %d')}")
+    return outfile
+
+# Per-run timing record: stage durations plus one entry per rendered chart.
+# Appended as a JSON line to TIMINGS_LOG_PATH at the end of each run.
+TIMINGS_LOG_PATH = Path("logs") / "flex_gantt_timings.jsonl"
+_run_timings = {"started": time.perf_counter(), "stages": {}, "charts": []}
+
+
+def reset_timings() -> None:
+    """Start a fresh timing record (called at the start of a run)."""
+    _run_timings.update(started=time.perf_counter(), stages={}, charts=[])
+
+
+@contextmanager
+def timed_stage(name: str):
+    """Add the duration of the enclosed block to the named stage."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _run_timings["stages"][name] = _run_timings["stages"].get(name, 0.0) + time.perf_counter() - start
+
+
+def record_chart(outfile: Path, events: int, filter_s: float, build_s: float, save_s: float) -> None:
+    """Record the per-stage cost of one rendered chart."""
+    _run_timings["charts"].append({
+        "chart": outfile.name,
+        "events": events,
+        "filter_s": round(filter_s, 4),
+        "build_s": round(build_s, 4),
+        "savefig_s": round(save_s, 4),
+    })
+
+
+def peak_rss_mb(who: int = None) -> float:
+    """Peak resident set size in MB (None where the resource module is unavailable)."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who is None else who)
+    # ru_maxrss is KB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(usage.ru_maxrss / scale, 1)
+
+
+def write_timing_record(log_path: Path, mode: str, **extra) -> dict:
+    """Append this run's timing record as one JSON line and return it."""
+    stages = dict(_run_timings["stages"])
+    charts = _run_timings["charts"]
+    # Per-chart stages are summed so the run totals cover every chart
+    for key, stage in (("filter_s", "filter"), ("build_s", "figure_build"), ("savefig_s", "savefig")):
+        if charts:
+            stages[stage] = sum(chart[key] for chart in charts)
+    
+    record = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "mode": mode,
+        **extra,
+        "total_s": round(time.perf_counter() - _run_timings["started"], 4),
+        "stages": {name: round(seconds, 4) for name, seconds in stages.items()},
+        "charts": charts,
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_rss_children_mb": peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None,
+    }
+    try:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        print(f"Warning: Could not write timing record: {e}")
+    return record
+
+
+def _render_task_with_timings(renderer, args: tuple, kwargs: dict) -> tuple:
+    """Process-pool entry point: run one render task and hand its chart timings back."""
+    _run_timings["charts"] = []
+    result = renderer(*args, **kwargs)
+    return result, _run_timings["charts"]
+
+
+def run_render_tasks(tasks: list[tuple], jobs: int = 1, force: bool = False, profile: str = None,
+                     optimize: bool = False, formats=()) -> list:
+    """
+    Run (renderer, args, kwargs) tasks, optionally across a process pool.
+    
+    Each task carries its own pre-filtered DataFrame slice so workers only
+    receive the rows they draw. Results come back in task order regardless
+    of which worker finishes first. With force=True charts are redrawn even
+    when their render fingerprint is unchanged; profile, if given, selects the
+    render profile for every task. With optimize=True (dashboard mode) charts
+    are written as optimized slides with their `formats` variants.
+    """
+    options = {}
+    if force:
+        options["force"] = True
+    if profile:
+        options["profile"] = profile
+    if optimize:
+        options["optimize"] = True
+        options["formats"] = tuple(formats)
+    if options:
+        tasks = [(renderer, args, {**kwargs, **options}) for renderer, args, kwargs in tasks]
+    
+    if jobs <= 1 or len(tasks) <= 1:
+        return [renderer(*args, **kwargs) for renderer, args, kwargs in tasks]
+    
+    # Flush before forking so buffered output isn't duplicated by the workers
+    sys.stdout.flush()
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        futures = [pool.submit(_render_task_with_timings, renderer, args, kwargs)
+                   for renderer, args, kwargs in tasks]
+        results = []
+        for future in futures:
+            result, charts = future.result()
+            _run_timings["charts"].extend(charts)
+            results.append(result)
+        return results
+
+
+def plan_current_calendar(df: pd.DataFrame, outdir: Path) -> list[tuple]:
+    """Remove stale calendars and return the task for the current month's calendar."""
+    current_date = datetime.now()
+    current_month = current_date.month
+    current_year = current_date.year
+    
+    print(f"Calendar mode: generating calendar for {calendar.month_name[current_month]} {current_year}")
+    
+    # Clean up old calendar files before generating new one
+    cleanup_old_calendars(outdir)
+    
+    mstart = pd.Timestamp(current_year, current_month, 1)
+    mend = pd.Timestamp(current_year, current_month, calendar.monthrange(current_year, current_month)[1])
+    return [(calendar_for_month, (events_in_window(df, mstart, mend), current_year, current_month, outdir), {})]
+
+
+def plan_calendars(df: pd.DataFrame, year: int, months: list[int], outdir: Path) -> list[tuple]:
+    """Return one calendar task per requested month of `year` (other calendars are left in place)."""
+    months = sorted(set(months))
+    print(f"Calendar mode: generating {len(months)} calendar(s) for {year}")
+
+    # Filter the dataframe once for the whole requested span, then slice per month
+    span_start = pd.Timestamp(year, months[0], 1)
+    span_end = pd.Timestamp(year, months[-1], calendar.monthrange(year, months[-1])[1])
+    df = events_in_window(df, span_start, span_end)
+
+    tasks = []
+    for month in months:
+        print(f"  {calendar.month_name[month]} {year}")
+        mstart = pd.Timestamp(year, month, 1)
+        mend = pd.Timestamp(year, month, calendar.monthrange(year, month)[1])
+        tasks.append((calendar_for_month, (events_in_window(df, mstart, mend), year, month, outdir), {}))
+    return tasks
+
+
+def render_calendars(df: pd.DataFrame, year: int, months: list[int], outdir: Path, jobs: int = 1,
+                     force: bool = False, profile: str = DEFAULT_PROFILE, optimize: bool = False,
+                     formats=()) -> list[Path]:
+    """
+    Render month calendars for any list of months from one loaded DataFrame.
+
+    For scripts that already hold the events from load_events(): the months are
+    rendered across `jobs` worker processes, with the same force/profile/optimize
+    options as run_render_tasks(). Returns the calendar paths in month order.
+    """
+    outdir.mkdir(parents=True, exist_ok=True)
+    return run_render_tasks(plan_calendars(df, year, months, outdir), jobs, force, profile, optimize, formats)
+
+
+def plan_year_overview(df: pd.DataFrame, year: int, outdir: Path) -> list[tuple]:
+    """Return the task for the year-at-a-glance overview of `year`."""
+    print(f"Year overview mode: generating 12-month overview for {year}")
+    window = events_in_window(df, pd.Timestamp(year, 1, 1), pd.Timestamp(year, 12, 31))
+    return [(year_overview, (window, year, outdir), {})]
+
+
+def plan_current_year_overview(df: pd.DataFrame, outdir: Path) -> list[tuple]:
+    """Remove overviews of other years and return the task for this year's overview."""
+    current_year = datetime.now().year
+    for overview in outdir.glob("year_overview_*.png"):
+        if overview.name != f"year_overview_{current_year}.png":
+            print(f"Removing old year overview: {overview.name}")
+            overview.unlink()
+    return plan_year_overview(df, current_year, outdir)
+
+
+def plan_today(df: pd.DataFrame, outdir: Path) -> list[tuple]:
+    """Return the task for the 'Happening Today' chart."""
+    print(f"Daily mode: generating 'Happening Today' chart")
+    day_start, day_end = get_current_day()
+    print(f"  Day: {day_start.strftime('%A, %B %d, %Y')}")
+    
+    return [(gantt_for_day, (events_in_window(df, day_start, day_end), outdir), {})]
+
+
+def plan_this_week(df: pd.DataFrame, outdir: Path) -> list[tuple]:
+    """Return the task for the 'Happening This Week' chart."""
+    print(f"Weekly mode: generating 'Happening This Week' chart")
+    week_start, week_end = get_current_week()
+    print(f"  Week: {week_start.strftime('%b %d')} - {week_end.strftime('%b %d, %Y')}")
+    
+    return [(gantt_for_week, (events_in_window(df, week_start, week_end), outdir), {})]
+
+
+def plan_rolling_window(df: pd.DataFrame, outdir: Path) -> list[tuple]:
+    """Remove charts that left the window and return tasks for the current month + next 3."""
+    months, years = get_rolling_months()
+    print(f"Rolling window mode: generating charts for current month + next 3 months")
+    for i, (month, year) in enumerate(zip(months, years)):
+        month_name = calendar.month_name[month]
+        print(f"  {i+1}. {month_name} {year}")
+    
+    # Clean up old charts before generating new ones
+    cleanup_old_charts(outdir, months, years)
+    
+    tasks = []
+    for i, (month, year) in enumerate(zip(months, years)):
+        # Filter data for this specific month/year
+        month_start = pd.Timestamp(year, month, 1)
+        month_end = pd.Timestamp(year, month, calendar.monthrange(year, month)[1])
+        month_df = events_in_window(df, month_start, month_end)
+        # Pass the month position for color coding (0=current, 1=next, 2=third, 3=fourth)
+        tasks.append((gantt_for_month, (month_df, year, month, outdir), {"month_position": i}))
+    return tasks
+
+
+def finalize_dashboard(outdir: Path, keep_days: int = DAILY_RETENTION_DAYS,
+                       keep_weeks: int = WEEKLY_RETENTION_WEEKS, formats=DEFAULT_SLIDE_FORMATS,
+                       jobs: int = 1, archive_dir: Path = ARCHIVE_DIR) -> None:
+    """Archive expired slides, optimize new/changed slides (writing their format variants) and rewrite the manifest."""
+    print("\nApplying slide retention...")
+    with timed_stage("retention"):
+        apply_retention(outdir, keep_days, keep_weeks, archive_dir)
+    
+    print("\nOptimizing images for dashboard...")
+    with timed_stage("optimize"):
+        optimize_slides(outdir, formats, jobs)
+    
+    print("\nGenerating slides manifest...")
+    with timed_stage("manifest"):
+        generate_slides_manifest(outdir)
+
+
+def render_all(workbook: Path, sheet_name: str = "Marriott Marquis Pipeline",
+               outdir: Path = Path("slides"), dashboard: bool = True,
+               use_cache: bool = True, jobs: int = 1, rules: list[dict] = None,
+               keep_days: int = DAILY_RETENTION_DAYS, keep_weeks: int = WEEKLY_RETENTION_WEEKS,
+               force: bool = False, profile: str = None, formats=DEFAULT_SLIDE_FORMATS,
+               archive_dir: Path = ARCHIVE_DIR) -> pd.DataFrame:
+    """
+    Render every dashboard slide (today, this week, rolling window, calendar, year overview) in one process.
+    
+    The workbook is parsed once and, in dashboard mode, the optimization pass and
+    manifest write run once at the end instead of after every chart type. With
+    jobs > 1 the eight charts (and any slides left to optimize) are processed
+    across a process pool. Without an explicit profile, dashboard slides use
+    DASHBOARD_PROFILE. Returns the loaded events.
+    """
+    outdir.mkdir(parents=True, exist_ok=True)
+    with timed_stage("load"):
+        df = load_events(workbook, sheet_name, use_cache=use_cache, rules=rules)
+    
+    tasks = plan_dashboard(df, outdir)
+    with timed_stage("render"):
+        run_render_tasks(tasks, jobs, force, resolve_profile(profile, dashboard), dashboard, formats)
+    
+    if dashboard:
+        finalize_dashboard(outdir, keep_days, keep_weeks, formats, jobs, archive_dir)
+    return df
+
+
+# Watch mode: poll the workbook and re-render only the slides whose windows hold changed rows
+WATCH_INTERVAL_SECONDS = 10.0
+WATCH_SETTLE_SECONDS = 2.0  # Wait for Excel/sync clients to finish writing before reading
+
+
+def workbook_signature(workbook: Path) -> tuple:
+    """(mtime_ns, size) of the workbook, or None while it is missing (mid-save)."""
+    try:
+        stat = workbook.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def plan_dashboard(df: pd.DataFrame, outdir: Path) -> list[tuple]:
+    """Return tasks for every dashboard slide (today, this week, rolling window, calendar, year overview)."""
+    tasks = plan_today(df, outdir)
+    print()
+    tasks += plan_this_week(df, outdir)
+    print()
+    tasks += plan_rolling_window(df, outdir)
+    print()
+    tasks += plan_current_calendar(df, outdir)
+    print()
+    tasks += plan_current_year_overview(df, outdir)
+    print()
+    return tasks
+
+
+def dashboard_slide_windows() -> dict[str, tuple[pd.Timestamp, pd.Timestamp]]:
+    """Map each current dashboard slide's filename to the date window it shows."""
+    day_start, day_end = get_current_day()
+    week_start, week_end = get_current_week()
+    windows = {
+        f"gantt_daily_{day_start.strftime('%Y_%m_%d')}.png": (day_start, day_end),
+        f"gantt_weekly_{week_start.strftime('%Y_%m_%d')}.png": (week_start, week_end),
+    }
+    months, years = get_rolling_months()
+    for month, year in zip(months, years):
+        windows[f"gantt_{year}_{month:02d}.png"] = (
+            pd.Timestamp(year, month, 1), pd.Timestamp(year, month, calendar.monthrange(year, month)[1]))
+    # The calendar shows the current month, the first month of the rolling window
+    windows[f"calendar_{years[0]}_{months[0]:02d}.png"] = windows[f"gantt_{years[0]}_{months[0]:02d}.png"]
+    year = day_start.year
+    windows[f"year_overview_{year}.png"] = (pd.Timestamp(year, 1, 1), pd.Timestamp(year, 12, 31))
+    return windows
+
+
+def slides_to_rebuild(ranges: pd.DataFrame) -> list[str]:
+    """Names of the dashboard slides whose windows overlap any changed date range."""
+    return [name for name, (start, end) in dashboard_slide_windows().items()
+            if ranges_overlap(ranges, start, end)]
+
+
+def plan_changed_slides(df: pd.DataFrame, ranges: pd.DataFrame, outdir: Path) -> list[tuple]:
+    """Return tasks only for the dashboard slides whose date windows contain changed events."""
+    rebuild = slides_to_rebuild(ranges)
+    tasks = []
+    if any(name.startswith("gantt_daily_") for name in rebuild):
+        tasks += plan_today(df, outdir)
+    if any(name.startswith("gantt_weekly_") for name in rebuild):
+        tasks += plan_this_week(df, outdir)
+    
+    months, years = get_rolling_months()
+    for i, (month, year) in enumerate(zip(months, years)):
+        if f"gantt_{year}_{month:02d}.png" in rebuild:
+            print(f"Rolling window: regenerating {calendar.month_name[month]} {year}")
+            month_start = pd.Timestamp(year, month, 1)
+            month_end = pd.Timestamp(year, month, calendar.monthrange(year, month)[1])
+            tasks.append((gantt_for_month, (events_in_window(df, month_start, month_end), year, month, outdir),
+                          {"month_position": i}))
+    if any(name.startswith("calendar_") for name in rebuild):
+        tasks += plan_current_calendar(df, outdir)
+    if any(name.startswith("year_overview_") for name in rebuild):
+        tasks += plan_current_year_overview(df, outdir)
+    return tasks
+
+
+def watch_workbook(workbook: Path, sheet_name: str = "Marriott Marquis Pipeline",
+                   outdir: Path = Path("slides"), dashboard: bool = True,
+                   use_cache: bool = True, jobs: int = 1, rules: list[dict] = None,
+                   keep_days: int = DAILY_RETENTION_DAYS, keep_weeks: int = WEEKLY_RETENTION_WEEKS,
+                   interval: float = WATCH_INTERVAL_SECONDS, timings_log: Path = TIMINGS_LOG_PATH,
+                   force: bool = False, profile: str = None, formats=DEFAULT_SLIDE_FORMATS,
+                   archive_dir: Path = ARCHIVE_DIR) -> None:
+    """
+    Keep the dashboard slides in sync with the workbook until interrupted.
+    
+    Renders every slide once, then polls the workbook's mtime and size. When it
+    changes, the new events are diffed against the previous load (event_diff) and only the
+    daily, weekly, month, calendar and year-overview slides whose windows contain changed rows
+    are re-rendered. Everything is re-rendered when the date rolls over.
+    """
+    outdir.mkdir(parents=True, exist_ok=True)
+    profile = resolve_profile(profile, dashboard)
+    print(f"Watching {workbook} every {interval:g}s (Ctrl+C to stop)\n")
+    
+    signature = workbook_signature(workbook)
+    df = render_all(workbook, sheet_name, outdir, dashboard=dashboard, use_cache=use_cache,
+                    jobs=jobs, rules=rules, keep_days=keep_days, keep_weeks=keep_weeks,
+                    force=force, profile=profile, formats=formats, archive_dir=archive_dir)
+    write_timing_record(timings_log, "watch", workbook=workbook.name, jobs=jobs, changed_rows=None)
+    rendered_day = datetime.now().date()
+    
+    try:
+        while True:
+            time.sleep(interval)
+            reset_timings()
+            
+            # New day: today/week/month/calendar windows all moved
+            if datetime.now().date() != rendered_day:
+                print(f"\n[{datetime.now():%H:%M:%S}] Date changed, regenerating all slides")
+                rendered_day = datetime.now().date()
+                tasks = plan_dashboard(df, outdir)
+                changed_rows = None
+            else:
+                current = workbook_signature(workbook)
+                if current is None or current == signature:
+                    continue
+                
+                # Only read once the file has stopped changing
+                time.sleep(WATCH_SETTLE_SECONDS)
+                if workbook_signature(workbook) != current:
+                    continue
+                
+                print(f"\n[{datetime.now():%H:%M:%S}] {workbook.name} changed, comparing events...")
+                try:
+                    with timed_stage("load"):
+                        new_df = load_events(workbook, sheet_name, use_cache=use_cache, rules=rules)
+                except Exception as e:
+                    # Usually a half-written file; the next poll retries
+                    print(f"Warning: Could not read {workbook.name}: {e}")
+                    continue
+                signature = current
+                
+                diff = diff_events(df, new_df)
+                df = new_df
+                changed_rows = len(diff)
+                print(f"Changes: {summarize_diff(diff)}")
+                if diff.empty:
+                    continue
+                
+                tasks = plan_changed_slides(df, affected_ranges(diff), outdir)
+                print(f"{changed_rows} changed event(s) affect {len(tasks)} slide(s)")
+                if not tasks:
+                    continue
+            
+            with timed_stage("render"):
+                run_render_tasks(tasks, jobs, force, profile, dashboard, formats)
+            if dashboard:
+                finalize_dashboard(outdir, keep_days, keep_weeks, formats, jobs, archive_dir)
+            write_timing_record(timings_log, "watch", workbook=workbook.name, jobs=jobs,
+                                changed_rows=changed_rows)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
+def run_mode(args: argparse.Namespace) -> str:
+    """Short name of the mode selected on the command line (for timing records)."""
+    for mode in ("all", "calendar", "year_overview", "daily", "weekly", "rolling_window"):
+        if getattr(args, mode):
+            return mode
+    return "months"
 
 
 def main() -> None:
     args = parse_args()
+    reset_timings()
+    
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    profile = resolve_profile(args.profile, args.dashboard)
     
     # Handle URL-encoded characters in the path
     decoded_workbook = unquote(args.workbook)
@@ -1304,76 +2621,77 @@ def main() -> None:
     
     if not wb.exists():
         sys.exit(f"Workbook not found: {wb}")
+    
+    try:
+        rules = load_filter_rules(args.rules)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Invalid filter rules: {e}")
 
     # Use slides directory if dashboard mode is enabled
+    formats = ()
     if args.dashboard:
         outdir = Path("slides")
         outdir.mkdir(parents=True, exist_ok=True)
+        formats = encodable_formats(args.formats)
+        for fmt in args.formats:
+            if fmt not in formats:
+                print(f"Warning: this Pillow build cannot write {fmt.upper()}; skipping .{fmt} slides")
     else:
         outdir = args.outdir or wb.parent
         outdir.mkdir(parents=True, exist_ok=True)
 
-    # Handle calendar mode
+    # Handle watch mode (runs until interrupted)
+    if args.watch:
+        watch_workbook(wb, args.sheet, outdir, dashboard=args.dashboard,
+                       use_cache=not args.no_cache, jobs=args.jobs, rules=rules,
+                       keep_days=args.keep_days, keep_weeks=args.keep_weeks,
+                       interval=args.watch_interval, timings_log=args.timings_log,
+                       force=args.force, profile=profile, formats=formats, archive_dir=args.archive_dir)
+        return
+    
+    # Handle render-everything mode (one load, one optimize pass, one manifest)
+    if args.all:
+        render_all(wb, args.sheet, outdir, dashboard=args.dashboard,
+                   use_cache=not args.no_cache, jobs=args.jobs, rules=rules,
+                   keep_days=args.keep_days, keep_weeks=args.keep_weeks,
+                   force=args.force, profile=profile, formats=formats, archive_dir=args.archive_dir)
+        write_timing_record(args.timings_log, "all", workbook=wb.name, jobs=args.jobs, profile=profile)
+        return
+    
+    with timed_stage("load"):
+        df = load_events(wb, args.sheet, use_cache=not args.no_cache, rules=rules)
+    
+    # Handle calendar mode (the current month, or the requested months of --year)
     if args.calendar:
-        current_date = datetime.now()
-        current_month = current_date.month
-        current_year = current_date.year
-        
-        print(f"Calendar mode: generating calendar for {calendar.month_name[current_month]} {current_year}")
-        
-        # Clean up old calendar files before generating new one
-        cleanup_old_calendars(outdir)
-        
-        # Generate calendar
-        df = load_events(wb, args.sheet)
-        calendar_for_month(df, current_year, current_month, outdir)
+        if args.months:
+            try:
+                months = [month_str_to_int(m) for m in args.months]
+            except ValueError as e:
+                sys.exit(e)
+            tasks = plan_calendars(df, args.year, months, outdir)
+        else:
+            tasks = plan_current_calendar(df, outdir)
+
+    # Handle year overview mode
+    elif args.year_overview:
+        tasks = plan_year_overview(df, args.year_overview, outdir)
         
     # Handle daily mode
     elif args.daily:
-        print(f"Daily mode: generating 'Happening Today' chart")
-        day_start, day_end = get_current_day()
-        print(f"  Day: {day_start.strftime('%A, %B %d, %Y')}")
-        
-        # Generate daily chart
-        df = load_events(wb, args.sheet)
-        gantt_for_day(df, outdir)
+        tasks = plan_today(df, outdir)
         
     # Handle weekly mode
     elif args.weekly:
-        print(f"Weekly mode: generating 'Happening This Week' chart")
-        week_start, week_end = get_current_week()
-        print(f"  Week: {week_start.strftime('%b %d')} - {week_end.strftime('%b %d, %Y')}")
-        
-        # Generate weekly chart
-        df = load_events(wb, args.sheet)
-        gantt_for_week(df, outdir)
+        tasks = plan_this_week(df, outdir)
         
     # Handle rolling window mode
     elif args.rolling_window:
-        months, years = get_rolling_months()
-        print(f"Rolling window mode: generating charts for current month + next 3 months")
-        for i, (month, year) in enumerate(zip(months, years)):
-            month_name = calendar.month_name[month]
-            print(f"  {i+1}. {month_name} {year}")
-        
-        # Clean up old charts before generating new ones
-        cleanup_old_charts(outdir, months, years)
-        
-        # Generate charts for each month/year combination
-        df = load_events(wb, args.sheet)
-        
-        for i, (month, year) in enumerate(zip(months, years)):
-            # Filter data for this specific month/year
-            month_start = pd.Timestamp(year, month, 1)
-            month_end = pd.Timestamp(year, month, calendar.monthrange(year, month)[1])
-            month_df = df[(df["Event End Date"] >= month_start) & (df["Event Start Date"] <= month_end)]
-            # Pass the month position for color coding (0=current, 1=next, 2=third, 3=fourth)
-            gantt_for_month(month_df, year, month, outdir, month_position=i)
+        tasks = plan_rolling_window(df, outdir)
         
     else:
         # Original behavior - validate months argument
         if not args.months:
-            sys.exit("Error: --months is required unless using --rolling-window, --weekly, --daily, or --calendar")
+            sys.exit("Error: --months is required unless using --rolling-window, --weekly, --daily, --calendar, --year-overview, or --all")
             
         # Convert requested months to integers (deduplicate & sort)
         try:
@@ -1381,26 +2699,27 @@ def main() -> None:
         except ValueError as e:
             sys.exit(e)
 
-        df = load_events(wb, args.sheet)
-
         # Filter the dataframe once for the whole requested span (speed)
         span_start = pd.Timestamp(args.year, months[0], 1)
         span_end = pd.Timestamp(
             args.year, months[-1], calendar.monthrange(args.year, months[-1])[1]
         )
-        df = df[(df["Event End Date"] >= span_start) & (df["Event Start Date"] <= span_end)]
+        df = events_in_window(df, span_start, span_end)
 
+        tasks = []
         for m in months:
-            gantt_for_month(df, args.year, m, outdir)
+            mstart = pd.Timestamp(args.year, m, 1)
+            mend = pd.Timestamp(args.year, m, calendar.monthrange(args.year, m)[1])
+            tasks.append((gantt_for_month, (events_in_window(df, mstart, mend), args.year, m, outdir), {}))
+    
+    with timed_stage("render"):
+        run_render_tasks(tasks, args.jobs, args.force, profile, args.dashboard, formats)
     
     # If in dashboard mode, optimize images and generate manifest
     if args.dashboard:
-        print("\nOptimizing images for dashboard...")
-        for png_file in outdir.glob("*.png"):
-            optimize_image_for_dashboard(png_file)
-        
-        print("\nGenerating slides manifest...")
-        generate_slides_manifest(outdir)
+        finalize_dashboard(outdir, args.keep_days, args.keep_weeks, formats, args.jobs, args.archive_dir)
+    
+    write_timing_record(args.timings_log, run_mode(args), workbook=wb.name, jobs=args.jobs, profile=profile)
 
 
 if __name__ == "__main__":
@@ -5,81 +5,56 @@ force_update_all.py
 Force regenerate all dashboard content immediately.
 Useful for testing or when you need all charts updated right away.
 
+Everything is rendered in this process via flex_gantt.render_all(): the workbook
+is parsed once, and the slides are optimized and the manifest written once at
+the end (equivalent to `python3 flex_gantt.py pipeline.xlsx --all --dashboard`).
+
 Usage:
     python3 force_update_all.py
 """
 
-import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
 
 
-def run_script(script_name, description):
-    """Run a Python script and return success status."""
-    print(f"\n{'='*60}")
-    print(f"Running {description}...")
-    print(f"{'='*60}")
-    
-    try:
-        result = subprocess.run(
-            ["python3", script_name],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        print(f"✅ {description} completed successfully")
-        if result.stdout:
-            print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed")
-        print(f"Error: {e.stderr}")
-        return False
-
-
 def main():
-    """Run all update scripts to force refresh all content."""
+    """Render all dashboard content in a single pass and push the result."""
     print(f"\nFORCE UPDATE ALL DASHBOARD CONTENT")
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*60)
     
-    # Check if required files exist
-    required_files = ["daily_update.py", "weekly_update.py", "monthly_update.py", "calendar_update.py"]
-    for file in required_files:
-        if not Path(file).exists():
-            print(f"❌ Error: {file} not found!")
-            sys.exit(1)
-    
-    # Run all updates
-    success_count = 0
-    total_count = 4
-    
-    # Daily update (Today's events)
-    if run_script("daily_update.py", "Daily Update (Happening Today)"):
-        success_count += 1
-    
-    # Weekly update (This week's events)
-    if run_script("weekly_update.py", "Weekly Update (Happening This Week)"):
-        success_count += 1
+    pipeline_file = Path("pipeline.xlsx")
+    if not pipeline_file.exists():
+        print(f"❌ Error: {pipeline_file} not found!")
+        sys.exit(1)
     
-    # Monthly update (3-month rolling window)
-    if run_script("monthly_update.py", "Monthly Update (3-Month Window + Calendar)"):
-        success_count += 1
+    try:
+        from flex_gantt import render_all, write_timing_record, TIMINGS_LOG_PATH
+        render_all(pipeline_file, outdir=Path("slides"), dashboard=True)
+        write_timing_record(TIMINGS_LOG_PATH, "all", workbook=pipeline_file.name, jobs=1)
+    except Exception as e:
+        print(f"\n❌ Dashboard render failed: {e}")
+        sys.exit(1)
     
     # Final summary
     print(f"\n{'='*60}")
-    print(f"SUMMARY: {success_count}/{total_count} updates completed successfully")
     print(f"Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
+    print("✅ All dashboard content has been updated!")
     
-    if success_count == total_count:
-        print("✅ All dashboard content has been updated!")
-        print("Reload your browser to see the latest charts.")
-    else:
-        print("⚠️  Some updates failed. Check the logs for details.")
-        sys.exit(1)
+    # Auto-commit and push changes to GitHub
+    try:
+        from git_auto_commit import auto_commit_and_push
+        if auto_commit_and_push(f"Auto-update: Forced full dashboard refresh - {datetime.now().strftime('%A, %B %d, %Y')}"):
+            print("✅ Changes pushed to GitHub successfully")
+        else:
+            print("⚠️  Failed to push changes to GitHub - manual commit and push may be required")
+    except Exception as e:
+        print(f"⚠️  Error during auto-commit: {e}")
+    
+    print("Reload your browser to see the latest charts.")
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
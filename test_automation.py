@@ -16,6 +16,7 @@ import requests
 from datetime import datetime, timedelta
 from pathlib import Path
 import sys
+import tempfile
 
 # Colors for output
 GREEN = '\033[92m'
@@ -233,8 +234,9 @@ def test_chart_generation():
         
     # Test daily chart generation
     print_status("info", "Testing daily chart generation...")
-    result = subprocess.run(['python3', 'flex_gantt.py', 'pipeline.xlsx', '--daily', '--test'], 
-                          capture_output=True, text=True)
+    with tempfile.TemporaryDirectory() as test_outdir:
+        result = subprocess.run(['python3', 'flex_gantt.py', 'pipeline.xlsx', '--daily', '--outdir', test_outdir], 
+                              capture_output=True, text=True)
     if result.returncode == 0:
         print_status("success", "Daily chart generation works")
     else:
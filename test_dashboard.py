@@ -172,6 +172,249 @@ def test_kiosk_setup():
     
     return True
 
+def test_dashboard_planning():
+    """Test that the automated dashboard runs plan and watch every slide in the rotation"""
+    print("\n🧪 Testing Dashboard Planning...")
+    
+    import tempfile
+    import pandas as pd
+    from flex_gantt import plan_dashboard, dashboard_slide_windows, plan_changed_slides, year_overview
+    
+    year = pd.Timestamp.now().year
+    events = pd.DataFrame({
+        "Event Name": ["Spring Gala", "Autumn Summit"],
+        "Event Start Date": [pd.Timestamp(year, 3, 2), pd.Timestamp(year, 10, 5)],
+        "Event End Date": [pd.Timestamp(year, 3, 4), pd.Timestamp(year, 10, 7)],
+        "Owner": ["Darren", "Sarah"],
+    })
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        outdir = Path(tmp)
+        (outdir / f"year_overview_{year - 1}.png").touch()
+        
+        # --all / force_update_all.py / the daily workflow render the year overview
+        renderers = [task[0] for task in plan_dashboard(events, outdir)]
+        if year_overview not in renderers:
+            print("  ❌ plan_dashboard() does not render the year overview")
+            return False
+        if (outdir / f"year_overview_{year - 1}.png").exists():
+            print("  ❌ Last year's overview was not removed")
+            return False
+        print("  ✅ Year overview is part of every dashboard run")
+        
+        # --watch rebuilds it when any event of this year changes
+        name = f"year_overview_{year}.png"
+        if dashboard_slide_windows().get(name) != (pd.Timestamp(year, 1, 1), pd.Timestamp(year, 12, 31)):
+            print(f"  ❌ No watch window for {name}")
+            return False
+        ranges = pd.DataFrame({"start": [pd.Timestamp(year, 1, 15)], "end": [pd.Timestamp(year, 1, 16)]})
+        if year_overview not in [task[0] for task in plan_changed_slides(events, ranges, outdir)]:
+            print("  ❌ Watch mode does not rebuild the year overview")
+            return False
+        print("  ✅ Watch mode rebuilds the year overview on changes")
+    
+    return True
+
+def sample_workbook(path, n_events=300, seed=3):
+    """Write a small random pipeline sheet (some events without an end date) for the index checks"""
+    import numpy as np
+    import pandas as pd
+    
+    rng = np.random.default_rng(seed)
+    starts = pd.Timestamp(2026, 1, 1) + pd.to_timedelta(rng.integers(0, 365, n_events), unit="D")
+    ends = pd.Series(starts + pd.to_timedelta(rng.integers(0, 20, n_events), unit="D"))
+    ends[rng.random(n_events) < 0.05] = pd.NaT
+    pd.DataFrame({
+        "Event Name": [f"Event {i}" for i in range(n_events)],
+        "Event Start Date": starts,
+        "Event End Date": ends,
+        "Owner": rng.choice(["Darren", "Dylan", "Sarah", "Eder", "David"], n_events),
+    }).to_excel(path, sheet_name="Marriott Marquis Pipeline", index=False)
+    return path
+
+def test_window_queries():
+    """Test the binary-search window index against a brute-force overlap mask"""
+    print("\n🧪 Testing Window Queries...")
+    
+    import tempfile
+    import pandas as pd
+    from flex_gantt import load_events, events_in_window
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        df = load_events(sample_workbook(Path(tmp) / "pipeline.xlsx"), "Marriott Marquis Pipeline", use_cache=False)
+    
+    first, last = df["Event Start Date"].min(), df["Event End Date"].max()
+    windows = [
+        (first - pd.Timedelta(days=30), first - pd.Timedelta(days=1)),  # Before the first event
+        (last + pd.Timedelta(days=1), last + pd.Timedelta(days=30)),    # After the last event
+        (first - pd.Timedelta(days=1), last + pd.Timedelta(days=1)),    # Everything
+        (first, first),
+        (last, last),
+    ]
+    windows += [(day, day + pd.Timedelta(days=span))
+                for day, span in zip(pd.date_range(first, last, freq="11D"), range(0, 200, 7))]
+    
+    for start, end in windows:
+        expected = df.loc[(df["Event Start Date"] <= end) & (df["Event End Date"] >= start)]
+        found = events_in_window(df, start, end)
+        if not found.index.equals(expected.index):
+            print(f"  ❌ events_in_window({start:%Y-%m-%d}, {end:%Y-%m-%d}) returned "
+                  f"{len(found)} rows, brute force {len(expected)}")
+            return False
+    
+    print(f"  ✅ {len(windows)} windows match the brute-force mask "
+          f"({int(df['Event End Date'].isna().sum())} events without an end date)")
+    return True
+
+def test_event_occupancy():
+    """Test the difference-array occupancy counts against counting each day directly"""
+    print("\n🧪 Testing Event Occupancy...")
+    
+    import numpy as np
+    import pandas as pd
+    from flex_gantt import event_occupancy
+    
+    rng = np.random.default_rng(11)
+    n_events = 400
+    starts = pd.Timestamp(2026, 1, 1) + pd.to_timedelta(rng.integers(-60, 425, n_events), unit="D")
+    # Times of day, multi-month events, events ending before they start and undated ends
+    starts = starts + pd.to_timedelta(rng.integers(0, 24, n_events), unit="h")
+    ends = pd.Series(starts + pd.to_timedelta(rng.integers(-3, 90, n_events), unit="D"))
+    ends[rng.random(n_events) < 0.05] = pd.NaT
+    events = pd.DataFrame({"Event Start Date": starts, "Event End Date": ends})
+    
+    windows = [(pd.Timestamp(2026, 1, 1), pd.Timestamp(2026, 12, 31)),
+               (pd.Timestamp(2026, 2, 1), pd.Timestamp(2026, 2, 28, 23, 59)),
+               (pd.Timestamp(2026, 6, 15), pd.Timestamp(2026, 6, 15)),
+               (pd.Timestamp(2020, 1, 1), pd.Timestamp(2020, 1, 31))]  # Before every event
+    for start, end in windows:
+        counts = event_occupancy(events, start, end)
+        days = pd.date_range(start.normalize(), end.normalize(), freq="D")
+        expected = [int(((events["Event Start Date"].dt.normalize() <= day)
+                         & (events["Event End Date"] >= day)
+                         & (events["Event End Date"] >= events["Event Start Date"].dt.normalize())).sum())
+                    for day in days]
+        if not counts.index.equals(days) or counts.tolist() != expected:
+            print(f"  ❌ Occupancy differs for {start:%Y-%m-%d} - {end:%Y-%m-%d}")
+            return False
+    
+    print(f"  ✅ {len(windows)} windows match per-day counting")
+    return True
+
+def test_calendar_slots():
+    """Test the bitmask calendar slot allocator against a naive per-slot greedy search"""
+    print("\n🧪 Testing Calendar Slot Allocation...")
+    
+    import random
+    from flex_gantt import allocate_calendar_slots
+    
+    def naive_slots(first_days, last_days, max_slots):
+        taken = {day: set() for day in range(32)}
+        overflow = [0] * 32
+        slots = []
+        for first, last in zip(first_days, last_days):
+            days = range(first, last + 1)
+            slot = next((s for s in range(max_slots) if all(s not in taken[d] for d in days)), -1)
+            if slot < 0:
+                for day in days:
+                    overflow[day] += 1
+            if not days or slot < 0:
+                slots.append(-1)
+                continue
+            for day in days:
+                taken[day].add(slot)
+            slots.append(slot)
+        return slots, overflow
+    
+    rng = random.Random(5)
+    cases = 0
+    for max_slots in (1, 3, 5, 8):
+        for n_events in (0, 1, 10, 60, 200):
+            first_days = [rng.randint(1, 31) for _ in range(n_events)]
+            # Mostly short events, some month-long, some empty (first > last)
+            last_days = [min(31, first + rng.choice([0, 0, 1, 2, 4, 30])) if rng.random() > 0.05 else first - 1
+                         for first in first_days]
+            expected = naive_slots(first_days, last_days, max_slots)
+            found = allocate_calendar_slots(first_days, last_days, max_slots)
+            if tuple(found) != expected:
+                print(f"  ❌ Allocation differs for {n_events} events, {max_slots} slots")
+                return False
+            cases += 1
+    
+    print(f"  ✅ {cases} layouts match the naive allocator (slots and overflow counts)")
+    return True
+
+def test_event_diff():
+    """Test event_diff change classification and affected date ranges"""
+    print("\n🧪 Testing Event Diff...")
+    
+    import pandas as pd
+    from event_diff import diff_events, affected_ranges, ID_COLUMN
+    
+    day = lambda d: pd.Timestamp(2026, 3, d)
+    columns = [ID_COLUMN, "Event Name", "Event Start Date", "Event End Date", "Owner", "Status"]
+    old = pd.DataFrame([
+        ("id-1", "Moved Gala", day(1), day(3), "Darren", "Won"),
+        ("id-2", "Handover Expo", day(5), day(6), "Dylan", "Won"),
+        ("id-3", "Status Summit", day(8), day(9), "Sarah", "Tentative"),
+        ("id-4", "Cancelled Forum", day(12), day(12), "Eder", "Won"),
+        ("id-5", "Steady Dinner", day(20), day(20), "David", "Won"),
+        ("id-6", "Twin Breakfast", day(22), day(22), "David", "Won"),
+        ("id-7", "Twin Breakfast", day(22), day(22), "David", "Won"),
+        ("id-9", "Double Lunch", day(24), day(24), "Eder", "Won"),
+        ("id-10", "Double Lunch", day(24), day(24), "Eder", "Tentative"),
+    ], columns=columns)
+    new = pd.DataFrame([
+        ("id-1", "Moved Gala", day(10), day(12), "Darren", "Won"),        # rescheduled
+        ("id-2", "Handover Expo", day(5), day(6), "Sarah", "Won"),        # reassigned
+        ("id-3", "Status Summit", day(8), day(9), "Sarah", "Won"),        # modified
+        ("id-5", "Steady Dinner", day(20), day(20), "David", "Won"),      # unchanged
+        ("id-6", "Twin Breakfast", day(22), day(22), "David", "Won"),     # unchanged duplicate
+        ("id-7", "Twin Breakfast", day(22), day(22), "David", "Lost"),    # modified duplicate
+        ("id-10", "Double Lunch", day(24), day(24), "Eder", "Tentative"), # unchanged duplicate
+        ("id-8", "New Launch", day(25), day(26), "Dylan", "Won"),         # added
+    ], columns=columns)                                                   # id-4, id-9 removed
+    expected = {"rescheduled": ["Moved Gala"], "reassigned": ["Handover Expo"],
+                "modified": ["Status Summit", "Twin Breakfast"],
+                "removed": ["Cancelled Forum", "Double Lunch"], "added": ["New Launch"]}
+    
+    for label, old_df, new_df in [("row IDs", old, new),
+                                  ("no row IDs", old.drop(columns=ID_COLUMN), new.drop(columns=ID_COLUMN))]:
+        diff = diff_events(old_df, new_df)
+        found = {change: sorted(diff.loc[diff["change"] == change, "event"]) for change in expected}
+        if found != expected or len(diff) != 7:
+            print(f"  ❌ Wrong classification with {label}: {found}")
+            return False
+        print(f"  ✅ Every change type classified with {label}")
+    
+    # With row IDs a renamed event is the same event, modified rather than removed + added
+    renamed = new.assign(**{"Event Name": new["Event Name"].replace("Status Summit", "Status Summit 2026")})
+    if diff_events(new, renamed)["change"].tolist() != ["modified"]:
+        print("  ❌ Renamed event with a row ID was not classified as modified")
+        return False
+    
+    if not diff_events(old, old).empty:
+        print("  ❌ Identical frames produced changes")
+        return False
+    
+    # Old and new spans of all changes merge into non-overlapping ranges: the removed
+    # Mar 12 event falls inside the rescheduled event's new Mar 10-12 span and is
+    # absorbed; adjacent spans (Mar 8-9, Mar 10-12) stay separate
+    ranges = affected_ranges(diff_events(old, new))
+    expected_ranges = [(day(1), day(3)), (day(5), day(6)), (day(8), day(9)), (day(10), day(12)),
+                       (day(22), day(22)), (day(24), day(24)), (day(25), day(26))]
+    if list(ranges.itertuples(index=False, name=None)) != expected_ranges:
+        print(f"  ❌ Unexpected affected ranges: {ranges.to_dict('records')}")
+        return False
+    single = affected_ranges(pd.DataFrame({"start_old": [pd.NaT], "start_new": [day(4)],
+                                           "end_old": [pd.NaT], "end_new": [pd.NaT]}))
+    if list(single.itertuples(index=False, name=None)) != [(day(4), day(4))]:
+        print(f"  ❌ Undated end not treated as a single day: {single.to_dict('records')}")
+        return False
+    print(f"  ✅ Affected ranges merged into {len(ranges)} non-overlapping spans")
+    
+    return True
+
 def test_file_structure():
     """Test overall file structure"""
     print("\n🧪 Testing File Structure...")
@@ -215,6 +458,11 @@ def main():
     tests = [
         ("File Structure", test_file_structure),
         ("Content Generation", test_content_generation),
+        ("Dashboard Planning", test_dashboard_planning),
+        ("Window Queries", test_window_queries),
+        ("Event Occupancy", test_event_occupancy),
+        ("Calendar Slot Allocation", test_calendar_slots),
+        ("Event Diff", test_event_diff),
         ("Presentation Layer", test_presentation_layer),
         ("Publication Layer", test_publication_layer),
         ("Kiosk Setup", test_kiosk_setup),
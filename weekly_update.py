@@ -10,7 +10,7 @@ Usage:
 
 This script will:
 1. Generate a "Happening This Week" chart for the current week (Monday to Sunday)
-2. Remove old weekly charts that are no longer current
+2. Archive old weekly charts to archive/*.zip (flex_gantt's --keep-weeks retention)
 3. Optimize images for dashboard display
 4. Update the slides manifest
 
@@ -48,45 +48,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def cleanup_old_weekly_charts():
-    """Remove old weekly chart files that are not from the current week."""
-    try:
-        slides_dir = Path("slides")
-        if not slides_dir.exists():
-            logger.info("Slides directory does not exist, nothing to clean up")
-            return
-        
-        # Get all weekly chart files
-        weekly_charts = list(slides_dir.glob("gantt_weekly_*.png"))
-        
-        if not weekly_charts:
-            logger.info("No existing weekly charts to clean up")
-            return
-        
-        # Get current week's Monday date for comparison
-        from datetime import datetime, timedelta
-        current_date = datetime.now()
-        days_since_monday = current_date.weekday()
-        current_monday = current_date - timedelta(days=days_since_monday)
-        current_week_filename = f"gantt_weekly_{current_monday.strftime('%Y_%m_%d')}.png"
-        
-        # Remove old weekly charts
-        removed_count = 0
-        for chart in weekly_charts:
-            if chart.name != current_week_filename:
-                logger.info(f"Removing old weekly chart: {chart.name}")
-                chart.unlink()
-                removed_count += 1
-        
-        if removed_count > 0:
-            logger.info(f"Cleaned up {removed_count} old weekly chart(s)")
-        else:
-            logger.info("No old weekly charts to remove")
-            
-    except Exception as e:
-        logger.error(f"Error cleaning up old weekly charts: {e}")
-
-
 def run_weekly_update():
     """Run the flex_gantt script with weekly mode."""
     try:
@@ -97,9 +58,6 @@ def run_weekly_update():
             logger.error(f"Pipeline file not found: {pipeline_file}")
             return False
         
-        # Clean up old weekly charts before generating new one
-        cleanup_old_weekly_charts()
-        
         # Run the flex_gantt script with weekly mode
         cmd = [
             "python3", 